@@ -5,7 +5,43 @@ Utility script to clear environment variable cache and reload .env file
 
 import os
 import sys
-from dotenv import load_dotenv
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+from dotenv import dotenv_values
+
+# The project's .env, next to this script, wherever it is run from
+ENV_FILE = Path(__file__).resolve().parent / ".env"
+
+# .env (path, mtime) at the last settings reset, so unchanged files don't trigger a reload
+_last_env_mtime: Optional[Tuple[str, int]] = None
+
+# Parsed .env values and the (path, mtime, size) they were read at
+_env_cache: Dict[str, str] = {}
+_env_stat: Optional[Tuple[str, int, int]] = None
+
+
+def reload_env_file() -> int:
+    """Apply .env values to os.environ, re-parsing the file only if it changed
+    
+    Returns:
+        Number of environment variables that were updated
+    """
+    global _env_cache, _env_stat
+    
+    try:
+        stat = os.stat(ENV_FILE)
+    except FileNotFoundError:
+        return 0
+    
+    stat_key = (str(ENV_FILE), stat.st_mtime_ns, stat.st_size)
+    if stat_key != _env_stat:
+        _env_cache = {key: value for key, value in dotenv_values(ENV_FILE).items() if value is not None}
+        _env_stat = stat_key
+    
+    # Only touch variables whose value actually differs
+    changed = {key: value for key, value in _env_cache.items() if os.environ.get(key) != value}
+    os.environ.update(changed)
+    return len(changed)
 
 
 def clear_env_cache():
@@ -14,60 +50,74 @@ def clear_env_cache():
     print("🧹 Clearing environment cache...")
     
     # Step 1: Clear environment variables from current session
-    env_prefixes = ['AZURE_', 'OLLAMA_', 'LANGFUSE_', 'GITHUB_', 'REDIS_', 'MODEL_']
-    cleared_vars = []
+    env_prefixes = ('AZURE_', 'OLLAMA_', 'LANGFUSE_', 'GITHUB_', 'REDIS_', 'MODEL_')
+    cleared_vars = [key for key in os.environ if key.startswith(env_prefixes)]
     
-    for key in list(os.environ.keys()):
-        if any(key.startswith(prefix) for prefix in env_prefixes):
-            del os.environ[key]
-            cleared_vars.append(key)
+    for key in cleared_vars:
+        del os.environ[key]
     
     print(f"   ✅ Cleared {len(cleared_vars)} environment variables")
     
     # Step 2: Clear Python module cache for config modules
-    modules_to_clear = []
-    for module_name in list(sys.modules.keys()):
-        if module_name.startswith('src.config') or module_name.startswith('src.services'):
-            del sys.modules[module_name]
-            modules_to_clear.append(module_name)
+    module_prefixes = ('src.config', 'src.services')
+    modules_to_clear = [name for name in list(sys.modules) if name.startswith(module_prefixes)]
+    
+    for module_name in modules_to_clear:
+        sys.modules.pop(module_name, None)
     
     print(f"   ✅ Cleared {len(modules_to_clear)} cached modules")
     
     # Step 3: Force reload .env file
     print("🔄 Reloading .env file...")
-    load_dotenv(override=True)
-    
-    # Step 4: Verify reload by checking a few key variables
-    print("🔍 Verifying environment variables:")
-    test_vars = ['AZURE_OPENAI_API_KEY', 'OLLAMA_ENDPOINT', 'GITHUB_PERSONAL_ACCESS_TOKEN']
+    updated = reload_env_file()
+    print(f"   ✅ Updated {updated} environment variables")
     
-    for var in test_vars:
-        value = os.getenv(var)
-        if value:
-            # Show first and last few characters for security
-            display_value = f"{value[:8]}...{value[-4:]}" if len(value) > 12 else "***"
-            print(f"   ✅ {var}: {display_value}")
-        else:
-            print(f"   ⚠️  {var}: Not set")
+    # Step 4: Verify reload by checking a few key variables (only useful on an interactive terminal)
+    if sys.stdout.isatty():
+        print("🔍 Verifying environment variables:")
+        test_vars = ['AZURE_OPENAI_API_KEY', 'OLLAMA_ENDPOINT', 'GITHUB_PERSONAL_ACCESS_TOKEN']
+        
+        for var in test_vars:
+            value = os.getenv(var)
+            if value:
+                # Show first and last few characters for security
+                display_value = f"{value[:8]}...{value[-4:]}" if len(value) > 12 else "***"
+                print(f"   ✅ {var}: {display_value}")
+            else:
+                print(f"   ⚠️  {var}: Not set")
     
     print("\n✅ Environment cache cleared and .env reloaded successfully!")
     print("💡 Note: Restart your application to ensure all components use the new values.")
 
 
+def _env_file_mtime() -> Optional[Tuple[str, int]]:
+    """Get the .env path and modification time, or None if the file doesn't exist"""
+    try:
+        return str(ENV_FILE), os.stat(ENV_FILE).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
 def reset_settings_singleton():
     """Reset the settings singleton to force reload"""
+    global _last_env_mtime
+    
+    env_mtime = _env_file_mtime()
+    if env_mtime is not None and env_mtime == _last_env_mtime:
+        print("   ✅ .env unchanged, keeping settings singleton")
+        return
+    _last_env_mtime = env_mtime
+    
     try:
         # Import after clearing cache
-        from src.config.settings import _settings
+        from src.config.settings import get_settings
         
-        # Reset global singleton
-        import src.config.settings as settings_module
-        settings_module._settings = None
+        # Reset cached singleton
+        get_settings.cache_clear()
         
         print("   ✅ Settings singleton reset")
         
         # Test reload
-        from src.config.settings import get_settings
         settings = get_settings()
         print("   ✅ Settings reloaded successfully")
         
@@ -1,15 +1,27 @@
 from src.agents.github_agent import create_github_agent
 from src.utils.prompt_loader import get_prompt_loader
+from src.utils.event_loop import new_event_loop
 import asyncio
+import os
 import uuid
 
 # Example usage functions
 async def example_queries():
     """Example queries to test the agent"""
+    # Example queries
+    prompt_loader = get_prompt_loader()
+    queries = prompt_loader.get_test_queries()
+    
+    # Draw the session, trace and per-query message IDs from a single urandom call
+    id_count = 2 + len(queries)
+    random_bytes = os.urandom(16 * id_count)
+    session_id, trace_id, *message_ids = [
+        str(uuid.UUID(bytes=random_bytes[i * 16:(i + 1) * 16], version=4))
+        for i in range(id_count)
+    ]
+    
     # Create agent with demo parameters
     user_id = "demo_user"
-    session_id = str(uuid.uuid4())
-    trace_id = str(uuid.uuid4())
     llm_model_name = "gpt-4o"
     agent = await create_github_agent(user_id, session_id, trace_id, llm_model_name)
     
@@ -20,20 +32,17 @@ async def example_queries():
     print(f"   LLM Model: {llm_model_name}")
     print("═" * 80)
     
-    # Example queries
-    prompt_loader = get_prompt_loader()
-    queries = prompt_loader.get_test_queries()
+    # Run all queries concurrently, then print them in order
+    responses = await agent.abatch(queries, message_ids)
     
-    for query in queries:
-        message_id = str(uuid.uuid4())
+    for query, message_id, response in zip(queries, message_ids, responses):
         print(f"\n🤖 Query: {query}")
         print(f"   Message ID: {message_id[:8]}...")
         print("─" * 50)
-        response = await agent.ainvoke(query, message_id)
         print(f"📝 Response: {response}")
         print("═" * 80)
 
 
 if __name__ == "__main__":
     # Run example queries
-    asyncio.run(example_queries())
+    asyncio.run(example_queries(), loop_factory=new_event_loop)
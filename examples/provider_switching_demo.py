@@ -1,8 +1,10 @@
 """Demo script showing dynamic provider switching."""
 
+import argparse
 import asyncio
+import os
+import sys
 import uuid
-from src.agents.github_agent import create_github_agent
 from src.config.settings import check_environment
 
 
@@ -17,10 +19,7 @@ async def demo_provider_switching():
         print("❌ Environment not properly configured. Please check your .env file.")
         return
     
-    # Session parameters
-    user_id = "demo_user"
-    session_id = str(uuid.uuid4())
-    trace_id = str(uuid.uuid4())
+    from src.agents.github_agent import create_github_agent
     
     # Test different providers
     models_to_test = [
@@ -28,16 +27,29 @@ async def demo_provider_switching():
         "ollama:llama2"
     ]
     
+    # Draw the session, trace and per-model message IDs from a single urandom call
+    id_count = 2 + len(models_to_test)
+    random_bytes = os.urandom(16 * id_count)
+    session_id, trace_id, *message_ids = [
+        str(uuid.UUID(bytes=random_bytes[i * 16:(i + 1) * 16], version=4))
+        for i in range(id_count)
+    ]
+    
+    # Session parameters
+    user_id = "demo_user"
+    
     test_message = "List public repositories for microsoft"
     
-    for model_name in models_to_test:
+    # Create the agent once and only swap the model, so tools are discovered a single time
+    agent = await create_github_agent(user_id, session_id, trace_id, models_to_test[0])
+    
+    for model_name, message_id in zip(models_to_test, message_ids):
         print(f"\n🔧 Testing {model_name}")
         print("-" * 30)
         
         try:
-            # Create agent with specific provider
-            agent = await create_github_agent(user_id, session_id, trace_id, model_name)
-            message_id = str(uuid.uuid4())
+            # Switch agent to the specific provider
+            agent.rebind_model(model_name)
             
             print(f"📤 Query: {test_message}")
             print(f"🤔 Processing... (Message ID: {message_id[:8]}...)")
@@ -66,6 +78,8 @@ async def interactive_provider_selection():
     if not await check_environment():
         return
     
+    from src.agents.github_agent import create_github_agent
+    
     # Available models
     available_models = {
         "1": "azure:gpt-4o",
@@ -123,6 +137,27 @@ async def interactive_provider_selection():
 def main():
     """Main entry point for demo."""
     
+    parser = argparse.ArgumentParser(description="LLM provider switching demo")
+    parser.add_argument(
+        "--mode",
+        choices=["1", "2"],
+        help="1: automatic provider switching test, 2: interactive provider selection"
+    )
+    args = parser.parse_args()
+    
+    demos = {
+        "1": demo_provider_switching,
+        "2": interactive_provider_selection
+    }
+    
+    # Run the requested demo directly, without the menu prompt
+    if args.mode:
+        asyncio.run(demos[args.mode]())
+        return
+    
+    if not sys.stdin.isatty():
+        parser.error("--mode is required when not running interactively")
+    
     print("🚀 LLM Provider Demo")
     print("=" * 30)
     print("1. Automatic provider switching test")
@@ -133,11 +168,8 @@ def main():
         try:
             choice = input("\n🔢 Choose an option (1-3): ").strip()
             
-            if choice == "1":
-                asyncio.run(demo_provider_switching())
-                break
-            elif choice == "2":
-                asyncio.run(interactive_provider_selection())
+            if choice in demos:
+                asyncio.run(demos[choice]())
                 break
             elif choice == "3":
                 print("👋 Goodbye!")
@@ -151,4 +183,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -17,8 +17,8 @@ Usage: python main.py
 import asyncio
 import uuid
 from src.config.settings import check_environment
-from src.utils.common import interactive_mode
 from src.utils.session_context import set_global_session_parameters
+from src.utils.event_loop import new_event_loop
 
 def main():
     """Main entry point"""
@@ -30,6 +30,13 @@ def main():
         if not await check_environment():
             return
         
+        # Deferred so the agent/LangGraph import chain is only paid once the environment is valid
+        from src.tools.github_tools import warm_start
+        from src.utils.common import interactive_mode
+        
+        # Begin tool discovery now if AGENT_WARM_START is set, it is awaited by the first question
+        warm_start()
+        
         # Generate session-level parameters for Langfuse tracking
         user_id = "demo_user"
         session_id = str(uuid.uuid4())
@@ -53,7 +60,9 @@ def main():
         await interactive_mode(user_id, session_id, trace_id, llm_model_name)
     
     try:
-        asyncio.run(run_application())
+        # One loop for the whole session, so client connection pools persist across questions
+        with asyncio.Runner(loop_factory=new_event_loop) as runner:
+            runner.run(run_application())
     except KeyboardInterrupt:
         print("\nApplication interrupted. Goodbye! 👋")
     except Exception as e:
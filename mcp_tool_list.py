@@ -8,54 +8,83 @@ import asyncio
 import sys
 import argparse
 import json
-from pathlib import Path
+import textwrap
+from collections import namedtuple
 from typing import Optional, List
-from src.tools.mcp_client.mcp_client import MCPClient
-from src.config.settings import get_settings
 
+try:
+    import orjson
+except ImportError:  # Optional, falls back to the stdlib json encoder
+    orjson = None
 
-def format_tool_name(name: str, max_width: int = 40) -> str:
-    """Format tool name with proper width"""
-    if len(name) <= max_width:
-        return name.ljust(max_width)
-    return name[:max_width-3] + "..."
+
+# Tool listings come from the MCP client's tools cache (see MCPClient.tools_cache_path)
+CachedTool = namedtuple("CachedTool", ["name", "description", "args_schema"])
+
+NO_DESCRIPTION = sys.intern("No description available")
+
+# JSON schemas per args_schema class, shared by tools that reuse the same model
+_schema_cache: dict = {}
+
+
+def get_schema(args_schema) -> dict:
+    """Get the JSON schema for a tool's args_schema, computing it once per class"""
+    if not hasattr(args_schema, 'model_json_schema'):
+        return {}
+    
+    schema = _schema_cache.get(args_schema)
+    if schema is None:
+        schema = args_schema.model_json_schema()
+        _schema_cache[args_schema] = schema
+    return schema
 
 
 def format_description(description: str, max_width: int = 80) -> str:
     """Format tool description with proper width"""
     if not description:
-        return "No description available"
+        return NO_DESCRIPTION
     
     if len(description) <= max_width:
         return description
     
-    # Try to break at word boundaries
-    words = description.split()
-    result = []
-    current_line = ""
-    
-    for word in words:
-        if len(current_line + word + " ") <= max_width:
-            current_line += word + " "
-        else:
-            if current_line:
-                result.append(current_line.strip())
-                current_line = word + " "
-            else:
-                # Word is too long, truncate it
-                result.append(word[:max_width-3] + "...")
-                current_line = ""
-    
-    if current_line:
-        result.append(current_line.strip())
+    # Break at word boundaries, continuation lines aligned under the description column
+    lines = textwrap.wrap(description, width=max_width, break_long_words=True, break_on_hyphens=False)
+    if len(lines) == 1:
+        return lines[0]
+    return lines[0] + "\n" + textwrap.indent("\n".join(lines[1:]), " " * 42)
+
+
+def load_cached_tools(client, server_names: List[str]) -> Optional[List[CachedTool]]:
+    """Load the servers' tool listings from the MCP client's cache, or None if any is missing"""
+    from src.tools.mcp_client.mcp_client import read_tools_cache
     
-    return "\n" + " " * 42 + ("\n" + " " * 42).join(result[1:]) if len(result) > 1 else result[0]
+    tools = []
+    for name in server_names:
+        listing = read_tools_cache(client.tools_cache_path(name))
+        if listing is None:
+            return None
+        tools.extend(
+            CachedTool(sys.intern(tool.name), tool.description, tool.inputSchema)
+            for tool in listing.tools
+        )
+    return tools
 
 
-async def list_mcp_tools(server_name: Optional[str] = None, detailed: bool = False, json_output: bool = False):
+def clear_cached_tools(client, server_names: List[str]) -> None:
+    """Remove the servers' cached tool listings, so the next listing comes from the server"""
+    for name in server_names:
+        cache_file = client.tools_cache_path(name)
+        if cache_file is not None:
+            cache_file.unlink(missing_ok=True)
+
+
+async def list_mcp_tools(server_name: Optional[str] = None, detailed: bool = False, json_output: bool = False,
+                         use_cache: bool = True):
     """List available tools from MCP server(s)"""
     
     try:
+        from src.tools.mcp_client.mcp_client import MCPClient
+        
         # Initialize MCP client
         print("🔍 Connecting to MCP server(s)..." if not json_output else "", file=sys.stderr if json_output else sys.stdout)
         
@@ -74,85 +103,111 @@ async def list_mcp_tools(server_name: Optional[str] = None, detailed: bool = Fal
             print(f"⚠️  Server '{server_name}' is disabled in configuration.")
             return False
         
-        # Get tools
-        async with client:
-            tools = await client.get_tools(server_name)
+        # Get tools from the client's tools cache, then from a running daemon. Both
+        # the daemon and the client below write the cache when they list the server.
+        server_names = [server_name] if server_name else enabled_servers
+        tools = None
+        if use_cache:
+            tools = load_cached_tools(client, server_names)
+        else:
+            clear_cached_tools(client, server_names)
+        
+        if tools is None and use_cache:
+            from src.tools.mcp_client.daemon import request_tools
             
-            if json_output:
-                # JSON output format
-                tools_data = []
-                for tool in tools:
-                    tool_data = {
-                        "name": tool.name,
-                        "description": tool.description or "No description available"
-                    }
-                    if detailed and hasattr(tool, 'args_schema') and tool.args_schema:
-                        try:
-                            # Get schema information
-                            schema = tool.args_schema.model_json_schema() if hasattr(tool.args_schema, 'model_json_schema') else {}
-                            tool_data["schema"] = schema
-                        except Exception:
-                            tool_data["schema"] = "Schema not available"
-                    
-                    tools_data.append(tool_data)
-                
-                result = {
-                    "server": server_name or "all",
-                    "total_tools": len(tools),
-                    "tools": tools_data
+            entries = await request_tools(server_name)
+            if entries is not None:
+                tools = [CachedTool(*entry) for entry in entries]
+        
+        if tools is None:
+            async with client:
+                tools = await client.get_tools(server_name)
+        
+        if json_output:
+            # JSON output format
+            tools_data = []
+            for tool in tools:
+                tool_data = {
+                    "name": tool.name,
+                    "description": tool.description or NO_DESCRIPTION
                 }
-                print(json.dumps(result, indent=2))
-                return True
-            
-            # Console output format
-            if not tools:
-                server_display = f" from server '{server_name}'" if server_name else ""
-                print(f"🔍 No tools found{server_display}")
-                return True
-            
-            # Header
-            server_display = f" from server '{server_name}'" if server_name else f" from {len(enabled_servers)} server(s)"
-            print(f"\n📋 Available MCP Tools{server_display}")
-            print(f"Found {len(tools)} tool(s)\n")
+                if detailed and hasattr(tool, 'args_schema') and tool.args_schema:
+                    try:
+                        # Get schema information
+                        tool_data["schema"] = get_schema(tool.args_schema)
+                    except Exception:
+                        tool_data["schema"] = "Schema not available"
+                
+                tools_data.append(tool_data)
             
-            if detailed:
-                # Detailed view with descriptions and schemas
-                print("=" * 120)
-                for i, tool in enumerate(tools, 1):
-                    print(f"{i:3d}. {tool.name}")
-                    print(f"     Description: {tool.description or 'No description available'}")
-                    
-                    # Try to get schema information
-                    if hasattr(tool, 'args_schema') and tool.args_schema:
-                        try:
-                            if hasattr(tool.args_schema, 'model_fields'):
-                                fields = tool.args_schema.model_fields
-                                if fields:
-                                    print(f"     Parameters:")
-                                    for field_name, field_info in fields.items():
-                                        field_desc = getattr(field_info, 'description', 'No description')
-                                        field_type = getattr(field_info, 'annotation', 'unknown')
-                                        print(f"       - {field_name}: {field_type} - {field_desc}")
-                                else:
-                                    print(f"     Parameters: None")
-                            else:
-                                print(f"     Parameters: Schema available but not readable")
-                        except Exception as e:
-                            print(f"     Parameters: Could not read schema ({e})")
-                    else:
-                        print(f"     Parameters: No schema available")
-                    
-                    print("-" * 120)
+            result = {
+                "server": server_name or "all",
+                "total_tools": len(tools),
+                "tools": tools_data
+            }
+            if orjson is not None:
+                # Write encoded bytes directly, skipping the text layer
+                sys.stdout.flush()
+                sys.stdout.buffer.write(orjson.dumps(result, option=orjson.OPT_INDENT_2, default=str) + b"\n")
+                sys.stdout.flush()
             else:
-                # Simple table view
-                print(f"{'#':>3} {'Tool Name':<40} {'Description'}")
-                print("=" * 120)
+                print(json.dumps(result, indent=2, default=str))
+            return True
+        
+        # Console output format
+        if not tools:
+            server_display = f" from server '{server_name}'" if server_name else ""
+            print(f"🔍 No tools found{server_display}")
+            return True
+        
+        # Build the whole listing first and write it in one go
+        lines: List[str] = []
+        
+        # Header
+        server_display = f" from server '{server_name}'" if server_name else f" from {len(enabled_servers)} server(s)"
+        lines.append(f"\n📋 Available MCP Tools{server_display}")
+        lines.append(f"Found {len(tools)} tool(s)\n")
+        
+        if detailed:
+            # Detailed view with descriptions and schemas
+            lines.append("=" * 120)
+            for i, tool in enumerate(tools, 1):
+                lines.append(f"{i:3d}. {tool.name}")
+                lines.append(f"     Description: {tool.description or NO_DESCRIPTION}")
                 
-                for i, tool in enumerate(tools, 1):
-                    name = format_tool_name(tool.name, 40)
-                    desc = format_description(tool.description or "No description available", 75)
-                    print(f"{i:3d} {name} {desc}")
+                # Try to get schema information
+                if hasattr(tool, 'args_schema') and tool.args_schema:
+                    try:
+                        if hasattr(tool.args_schema, 'model_fields'):
+                            fields = tool.args_schema.model_fields
+                            if fields:
+                                lines.append(f"     Parameters:")
+                                for field_name, field_info in fields.items():
+                                    field_desc = getattr(field_info, 'description', 'No description')
+                                    field_type = getattr(field_info, 'annotation', 'unknown')
+                                    lines.append(f"       - {field_name}: {field_type} - {field_desc}")
+                            else:
+                                lines.append(f"     Parameters: None")
+                        else:
+                            lines.append(f"     Parameters: Schema available but not readable")
+                    except Exception as e:
+                        lines.append(f"     Parameters: Could not read schema ({e})")
+                else:
+                    lines.append(f"     Parameters: No schema available")
+                
+                lines.append("-" * 120)
+        else:
+            # Simple table view
+            lines.append(f"{'#':>3} {'Tool Name':<40} {'Description'}")
+            lines.append("=" * 120)
             
+            for i, tool in enumerate(tools, 1):
+                name = tool.name if len(tool.name) <= 40 else tool.name[:37] + "..."
+                desc = format_description(tool.description or NO_DESCRIPTION, 75)
+                lines.append(f"{i:3d} {name:<40} {desc}")
+        
+        sys.stdout.write("\n".join(lines) + "\n")
+        
         return True
         
     except FileNotFoundError as e:
@@ -169,6 +224,8 @@ async def list_mcp_tools(server_name: Optional[str] = None, detailed: bool = Fal
 def show_server_info():
     """Show available servers"""
     try:
+        from src.tools.mcp_client.mcp_client import MCPClient
+        
         client = MCPClient()
         servers = client.config["servers"]
         
@@ -203,6 +260,8 @@ Examples:
   python mcp_tool_list.py github --detailed  # List tools with detailed information
   python mcp_tool_list.py --servers          # Show available servers
   python mcp_tool_list.py github --json      # Output in JSON format
+  python mcp_tool_list.py github --no-cache  # Bypass the cached tool list
+  python mcp_tool_list.py --daemon           # Keep an MCP client alive for later calls
         """
     )
     
@@ -230,6 +289,18 @@ Examples:
         help="Show available servers and exit"
     )
     
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Run a long-lived MCP client that serves tool listings to later invocations"
+    )
+    
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Query the MCP server directly, refreshing the cached tool list and skipping the daemon"
+    )
+    
     parser.add_argument(
         "--debug",
         action="store_true",
@@ -243,11 +314,23 @@ Examples:
         show_server_info()
         return
     
+    # Serve tool listings until interrupted
+    if args.daemon:
+        from src.tools.mcp_client.daemon import MCPClientDaemon, DEFAULT_SOCKET_PATH
+        
+        print(f"🛰️  Serving MCP tool listings on {DEFAULT_SOCKET_PATH} (Ctrl+C to stop)")
+        try:
+            asyncio.run(MCPClientDaemon().serve_forever())
+        except KeyboardInterrupt:
+            print("\n👋 Daemon stopped")
+        return
+    
     # Run the tool listing
     success = asyncio.run(list_mcp_tools(
         server_name=args.server_name,
         detailed=args.detailed,
-        json_output=args.json
+        json_output=args.json,
+        use_cache=not args.no_cache
     ))
     
     if not success:
@@ -2,12 +2,22 @@
 GitHub Agent using LangGraph with Dynamic LLM Provider Support and Langfuse
 """
 import asyncio
+import logging
 import uuid
+from typing import AsyncIterator, List, Optional, Tuple
 from langchain_core.messages import HumanMessage, AIMessage
+from langgraph.checkpoint.memory import MemorySaver
 
+from src.config.parameters import AGENT_BATCH_CONCURRENCY, AGENT_CONVERSATION_MEMORY, AGENT_WARMUP_PING
 from src.tools.github_tools import get_github_tools
-from src.utils.nodes import create_llm_with_tools
-from src.utils.graph import create_agent_graph
+from src.utils.nodes import create_llm_with_tools, get_tool_llm
+from src.utils.graph import create_agent_graph, get_system_message
+from src.utils.event_loop import run_in_background_loop
+
+logger = logging.getLogger(__name__)
+
+# Prefix of the text returned in place of an answer when processing fails
+ERROR_RESPONSE_PREFIX = "Error processing request: "
 
 
 class GitHubAgent:
@@ -18,7 +28,14 @@ class GitHubAgent:
     Supports multiple LLM providers (Azure OpenAI, Ollama) via provider:model format.
     """
     
-    def __init__(self, user_id: str, session_id: str, trace_id: str, llm_model_name: str):
+    def __init__(
+        self,
+        user_id: str,
+        session_id: str,
+        trace_id: str,
+        llm_model_name: str,
+        conversation_memory: Optional[bool] = None
+    ):
         """Initialize the GitHub agent with LLM and workflow graph.
         
         Args:
@@ -26,30 +43,84 @@ class GitHubAgent:
             session_id: Session identifier for Langfuse tracking
             trace_id: Trace identifier for Langfuse tracking
             llm_model_name: LLM model name in format "provider:model" (e.g., "azure:gpt-4o", "ollama:llama2")
+            conversation_memory: Keep conversations in a checkpointer, defaults to AGENT_CONVERSATION_MEMORY
         """
         self.user_id = user_id
         self.session_id = session_id
         self.trace_id = trace_id
         self.llm_model_name = llm_model_name
+        self.conversation_memory = conversation_memory
         self.tools = None  # Will be loaded asynchronously
+        self.graph = None  # Compiled once tools are loaded
+        self._warmup_task: Optional[asyncio.Task] = None
+        self._ping_task: Optional[asyncio.Task] = None
+        self._started_threads = set()  # Conversation threads already seeded with the system message
     
-    async def ainvoke(self, message: str, message_id: str, **kwargs) -> str:
-        """Invoke the agent asynchronously.
+    def rebind_model(self, llm_model_name: str) -> None:
+        """Switch the agent to a different LLM model.
+        
+        Already loaded tools are kept, so switching models does not repeat
+        MCP tool discovery.
+        
+        Args:
+            llm_model_name: LLM model name in format "provider:model" (e.g., "azure:gpt-4o", "ollama:llama2")
+        """
+        self.llm_model_name = llm_model_name
+    
+    @property
+    def _memory(self) -> bool:
+        """Whether conversations are kept in a checkpointer"""
+        return AGENT_CONVERSATION_MEMORY if self.conversation_memory is None else self.conversation_memory
+    
+    async def load_tools(self) -> None:
+        """Load tools and compile the workflow graph if not already done."""
+        if self.tools is None:
+            self.tools = await get_github_tools()
+        if self.graph is None:
+            checkpointer = MemorySaver() if self._memory else None
+            self.graph = create_agent_graph(None, self.tools, checkpointer=checkpointer)
+    
+    async def warmup(self) -> None:
+        """Load tools and build the LLM client ahead of the first message.
+        
+        With AGENT_WARMUP_PING, also starts a short untracked request in the
+        background so the provider connection is already open. Messages don't
+        wait for it. Failures are only logged, the first message reports them.
+        """
+        try:
+            await self.load_tools()
+            llm = get_tool_llm(self.llm_model_name, self.tools)
+            if AGENT_WARMUP_PING:
+                self._ping_task = asyncio.create_task(self._ping(llm))
+        except Exception as e:
+            logger.warning(f"Agent warmup failed: {e}")
+    
+    async def _ping(self, llm) -> None:
+        """Send the warmup request, unique so the response cache can't answer it"""
+        try:
+            await llm.ainvoke([HumanMessage(content=f"ping {uuid.uuid4()}")])
+        except Exception as e:
+            logger.warning(f"Agent warmup ping failed: {e}")
+    
+    async def _prepare(self, message: str, message_id: str, kwargs: dict) -> Tuple[dict, dict]:
+        """Load tools and the workflow graph, and build the input and LLM for a message.
         
         Args:
             message: User message to process
             message_id: Unique identifier for this message
-            **kwargs: Additional arguments for graph invocation
+            kwargs: Additional arguments for the graph run
             
         Returns:
-            Agent response as string
+            Tuple of (initial state, graph run arguments with this message's LLM in the run config)
         """
-        # Load tools if not already loaded
-        if self.tools is None:
-            self.tools = await get_github_tools()
+        # Let a warmup started on this loop finish rather than duplicate its work
+        warmup_task = self._warmup_task
+        if warmup_task is not None and warmup_task.get_loop() is asyncio.get_running_loop():
+            await warmup_task
+        await self.load_tools()
         
         # Create LLM with current message context using registry
-        self.llm = create_llm_with_tools(
+        llm = create_llm_with_tools(
             llm_model_name=self.llm_model_name,
             tools=self.tools,
             user_id=self.user_id,
@@ -57,13 +128,37 @@ class GitHubAgent:
             trace_id=self.trace_id,
             message_id=message_id
         )
-        self.graph = create_agent_graph(self.llm, self.tools)
-        try:
-            # Create initial state
-            initial_state = {
-                "messages": [HumanMessage(content=message)]
-            }
+        
+        # Pass the LLM per run so concurrent messages don't share it
+        config = dict(kwargs.get("config") or {})
+        configurable = {**config.get("configurable", {}), "llm": llm}
+        config["configurable"] = configurable
+        
+        # With conversation memory only the first turn of a thread carries the system message
+        messages = [HumanMessage(content=message)]
+        if self._memory:
+            thread_id = configurable.setdefault("thread_id", self.session_id)
+            if thread_id not in self._started_threads:
+                self._started_threads.add(thread_id)
+                messages.insert(0, get_system_message())
+        else:
+            messages.insert(0, get_system_message())
+        
+        return {"messages": messages}, {**kwargs, "config": config}
+    
+    async def ainvoke(self, message: str, message_id: str, **kwargs) -> str:
+        """Invoke the agent asynchronously.
+        
+        Args:
+            message: User message to process
+            message_id: Unique identifier for this message
+            **kwargs: Additional arguments for graph invocation
             
+        Returns:
+            Agent response as string
+        """
+        initial_state, kwargs = await self._prepare(message, message_id, kwargs)
+        try:
             # Run the graph
             result = await self.graph.ainvoke(initial_state, **kwargs)
             
@@ -77,11 +172,93 @@ class GitHubAgent:
                 return str(final_message)
                 
         except Exception as e:
-            return f"Error processing request: {str(e)}"
+            return f"{ERROR_RESPONSE_PREFIX}{str(e)}"
+    
+    async def abatch(
+        self,
+        messages: List[str],
+        message_ids: List[str],
+        concurrency: int = AGENT_BATCH_CONCURRENCY,
+        **kwargs
+    ) -> List[str]:
+        """Invoke the agent on several messages concurrently.
+        
+        Each message runs as its own conversation thread, so concurrent
+        messages never interleave in one conversation. With conversation
+        memory, each thread is deleted once its message is answered.
+        
+        Args:
+            messages: User messages to process
+            message_ids: Unique identifier for each message
+            concurrency: Maximum number of messages processed at once
+            **kwargs: Additional arguments for graph invocation
+            
+        Returns:
+            Agent responses, in the same order as messages
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def invoke_one(message: str, message_id: str) -> str:
+            thread_id = f"{self.session_id}:{message_id}"
+            config = dict(kwargs.get("config") or {})
+            config["configurable"] = {"thread_id": thread_id, **config.get("configurable", {})}
+            async with semaphore:
+                try:
+                    return await self.ainvoke(message, message_id, **{**kwargs, "config": config})
+                finally:
+                    if config["configurable"]["thread_id"] == thread_id:
+                        await self._delete_thread(thread_id)
+        
+        return await asyncio.gather(*(
+            invoke_one(message, message_id)
+            for message, message_id in zip(messages, message_ids)
+        ))
+    
+    async def _delete_thread(self, thread_id: str) -> None:
+        """Forget a finished one-shot conversation thread"""
+        self._started_threads.discard(thread_id)
+        checkpointer = getattr(self.graph, "checkpointer", None)
+        if checkpointer is not None:
+            await checkpointer.adelete_thread(thread_id)
+    
+    async def astream(self, message: str, message_id: str, **kwargs) -> AsyncIterator[str]:
+        """Stream the agent response as tokens are generated.
+        
+        Args:
+            message: User message to process
+            message_id: Unique identifier for this message
+            **kwargs: Additional arguments for graph streaming
+            
+        Yields:
+            Response text chunks from the LLM, in generation order. A reply
+            served from the response cache is yielded as one chunk.
+        """
+        initial_state, kwargs = await self._prepare(message, message_id, kwargs)
+        # LLM runs that streamed text. A response cache hit streams nothing
+        # and only reports the final message when the run ends.
+        streamed = set()
+        try:
+            async for event in self.graph.astream_events(initial_state, version="v2", **kwargs):
+                if event["event"] == "on_chat_model_stream":
+                    # Tool call chunks carry no text content
+                    content = event["data"]["chunk"].content
+                    if content:
+                        streamed.add(event["run_id"])
+                        yield content
+                elif event["event"] == "on_chat_model_end" and event["run_id"] not in streamed:
+                    content = getattr(event["data"].get("output"), "content", None)
+                    if content:
+                        yield content
+                        
+        except Exception as e:
+            yield f"{ERROR_RESPONSE_PREFIX}{str(e)}"
     
     def invoke(self, message: str, message_id: str, **kwargs) -> str:
         """Invoke the agent synchronously.
         
+        Runs on a persistent background event loop rather than a fresh loop
+        per call.
+        
         Args:
             message: User message to process
             message_id: Unique identifier for this message
@@ -90,19 +267,31 @@ class GitHubAgent:
         Returns:
             Agent response as string
         """
-        return asyncio.run(self.ainvoke(message, message_id, **kwargs))
+        return run_in_background_loop(self.ainvoke(message, message_id, **kwargs))
 
 
-async def create_github_agent(user_id: str, session_id: str, trace_id: str, llm_model_name: str) -> GitHubAgent:
+async def create_github_agent(
+    user_id: str,
+    session_id: str,
+    trace_id: str,
+    llm_model_name: str,
+    conversation_memory: Optional[bool] = None
+) -> GitHubAgent:
     """Factory function to create a GitHub agent.
     
+    Tool discovery and the LLM connection are warmed up in the background,
+    so they overlap with whatever the caller does before the first message.
+    
     Args:
         user_id: User identifier for Langfuse tracking
         session_id: Session identifier for Langfuse tracking
         trace_id: Trace identifier for Langfuse tracking
         llm_model_name: LLM model name in format "provider:model" (e.g., "azure:gpt-4o", "ollama:llama2")
+        conversation_memory: Keep conversations in a checkpointer, defaults to AGENT_CONVERSATION_MEMORY
         
     Returns:
         Configured GitHubAgent instance
     """
-    return GitHubAgent(user_id, session_id, trace_id, llm_model_name)
\ No newline at end of file
+    agent = GitHubAgent(user_id, session_id, trace_id, llm_model_name, conversation_memory)
+    agent._warmup_task = asyncio.create_task(agent.warmup())
+    return agent
\ No newline at end of file
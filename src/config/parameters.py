@@ -4,9 +4,41 @@ Centralized configuration parameters for the GitHub MCP Agent
 
 # Agent Parameters
 AGENT_TEMPERATURE = 0.1
-AGENT_STREAMING = False
+AGENT_STREAMING = True
+
+# Exact-match LLM response cache, keyed on the model, bound tools and full message list.
+# Tool calls still run on every request, so a changed tool result misses the cache.
+# Off by default, and only attached to models sampling at temperature 0, since a
+# cached reply would otherwise pin one sample of a non-deterministic model.
+AGENT_RESPONSE_CACHE = False
+AGENT_RESPONSE_CACHE_SIZE = 256
+
+# Retries for rate-limited or failed LLM requests. The OpenAI client backs off
+# exponentially with jitter and honours the server's Retry-After header.
+AGENT_MAX_RETRIES = 5
+
+# Maximum number of messages processed at once by GitHubAgent.abatch
+AGENT_BATCH_CONCURRENCY = 5
+
+# Send a one-off "ping" to the LLM when an agent is created, so the first question
+# reuses a warm connection. Costs one billable request per agent, including the bound
+# tool schemas, so it is off by default. Messages never wait for the ping.
+AGENT_WARMUP_PING = False
+
+# Start GitHub tool discovery in the background at startup, so the MCP server
+# handshake overlaps with the rest of startup instead of the first question.
+AGENT_WARM_START = False
+
+# Keep each session's conversation in an in-memory checkpointer, so follow-up
+# questions see earlier turns and only the new message is passed in per turn.
+# The LLM still receives the whole, untrimmed history on every turn, so token
+# cost grows with the conversation. Off by default, which keeps agents stateless.
+AGENT_CONVERSATION_MEMORY = False
 
 # Service Default Parameters
+SERVICE_CACHE_TTL = 60  # Seconds a GitHubService answer is reused for the same question
+SERVICE_CACHE_SIZE = 512
+SERVICE_BATCH_CONCURRENCY = 8  # Maximum concurrent questions in GitHubService.get_many_* calls
 DEFAULT_PR_LIMIT = 5
 DEFAULT_COMMIT_LIMIT = 10
 DEFAULT_BRANCH = "main"
\ No newline at end of file
@@ -2,7 +2,8 @@
 Configuration settings for AI Agent Application
 """
 import os
-from typing import Optional
+import functools
+from typing import Tuple
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -30,22 +31,26 @@ class Settings:
         self.GITHUB_PERSONAL_ACCESS_TOKEN = os.getenv('GITHUB_PERSONAL_ACCESS_TOKEN')
         self.GITHUB_HOST = os.getenv('GITHUB_HOST', 'https://api.github.com')
 
-# Global settings instance
-_settings: Optional[Settings] = None
-
+@functools.cache
 def get_settings() -> Settings:
-    """Get application settings singleton"""
-    global _settings
-    if _settings is None:
-        _settings = Settings()
-    return _settings
+    """Get application settings singleton
+    
+    Call ``get_settings.cache_clear()`` to reload settings from the environment.
+    """
+    return Settings()
 
-async def check_environment():
-    """Check if required environment variables are set based on usage."""
-    settings = get_settings()
+@functools.lru_cache(maxsize=1)
+def _environment_status(settings: Settings) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """Compute missing environment variables and configured providers.
     
+    Cached per settings instance, so reloading settings with
+    ``get_settings.cache_clear()`` also refreshes the status.
+    
+    Returns:
+        Tuple of (missing variable descriptions, configured provider names)
+    """
     # Import here to avoid circular imports
-    from src.services.langfuse_service import get_langfuse_service
+    from src.services.langfuse_service import LangfuseService
     
     missing_vars = []
     
@@ -54,7 +59,7 @@ async def check_environment():
         missing_vars.append("GITHUB_PERSONAL_ACCESS_TOKEN")
     
     # Check Langfuse configuration using service
-    langfuse_service = get_langfuse_service()
+    langfuse_service = LangfuseService(settings)
     is_valid_langfuse, missing_langfuse = langfuse_service.validate_configuration()
     if not is_valid_langfuse:
         missing_vars.extend(missing_langfuse)
@@ -73,13 +78,6 @@ async def check_environment():
             "Or Ollama (OLLAMA_ENDPOINT) must be configured"
         ])
     
-    if missing_vars:
-        print("❌ Missing required environment variables:")
-        for var in missing_vars:
-            print(f"  - {var}")
-        print("\nPlease set these variables in your .env file or environment.")
-        return False
-    
     # Show which providers are configured
     configured_providers = []
     if azure_configured:
@@ -87,11 +85,25 @@ async def check_environment():
     if ollama_configured:
         configured_providers.append(f"Ollama ({settings.OLLAMA_ENDPOINT})")
     
+    return tuple(missing_vars), tuple(configured_providers)
+
+async def check_environment():
+    """Check if required environment variables are set based on usage."""
+    missing_vars, configured_providers = _environment_status(get_settings())
+    
+    if missing_vars:
+        print("❌ Missing required environment variables:")
+        for var in missing_vars:
+            print(f"  - {var}")
+        print("\nPlease set these variables in your .env file or environment.")
+        return False
+    
     print("✅ Environment configuration is valid!")
     print(f"📊 Configured providers: {', '.join(configured_providers)}")
     
     # Show Langfuse status
-    langfuse_status = langfuse_service.get_health_status()
+    from src.services.langfuse_service import get_langfuse_service
+    langfuse_status = get_langfuse_service().get_health_status()
     print("\n📈 Langfuse Configuration:")
     print(f"  Host: {langfuse_status['host']}")
     print(f"  Status: {'✅ Configured' if langfuse_status['configured'] else '❌ Invalid'}")
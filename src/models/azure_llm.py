@@ -1,13 +1,15 @@
 """Azure OpenAI LLM provider implementation."""
 
 from typing import List, Optional
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.runnables import Runnable
 from langchain_core.tools import BaseTool
 from langchain_openai import AzureChatOpenAI
 
 from src.config.settings import get_settings
-from src.config.parameters import AGENT_TEMPERATURE, AGENT_STREAMING
+from src.config.parameters import AGENT_TEMPERATURE, AGENT_STREAMING, AGENT_MAX_RETRIES
 from src.services.langfuse_service import LangfuseService, get_langfuse_service
-from .base_provider import BaseLLMProvider
+from .base_provider import BaseLLMProvider, get_response_cache, get_tool_schemas
 
 
 class AzureLLMProvider(BaseLLMProvider):
@@ -76,7 +78,32 @@ class AzureLLMProvider(BaseLLMProvider):
         )
         
         # Create Azure OpenAI LLM instance
-        llm = AzureChatOpenAI(
+        llm = self._build_llm(model_name, callbacks=[langfuse_handler])
+        
+        # Bind tools to enable function calling
+        llm_with_tools = llm.bind_tools(tools=tools)
+        return llm_with_tools
+    
+    def create_tool_llm(self, model_name: str, tools: List[BaseTool], **kwargs) -> Runnable:
+        """Create Azure OpenAI LLM with tools bound but no tracking callbacks.
+        
+        Args:
+            model_name: The Azure deployment/model name (e.g., "gpt-4o")
+            tools: List of tools to bind to the LLM for function calling
+            **kwargs: Additional Azure-specific arguments
+            
+        Returns:
+            AzureChatOpenAI instance with bound tools
+        """
+        return self._build_llm(model_name).bind_tools(tools=get_tool_schemas(tools))
+    
+    def _build_llm(
+        self,
+        model_name: str,
+        callbacks: Optional[List[BaseCallbackHandler]] = None
+    ) -> AzureChatOpenAI:
+        """Construct the Azure OpenAI chat model."""
+        return AzureChatOpenAI(
             azure_endpoint=self.settings.AZURE_OPENAI_ENDPOINT,
             api_key=self.settings.AZURE_OPENAI_API_KEY,
             api_version=self.settings.AZURE_OPENAI_API_VERSION,
@@ -84,9 +111,7 @@ class AzureLLMProvider(BaseLLMProvider):
             model=model_name,
             temperature=AGENT_TEMPERATURE,
             streaming=AGENT_STREAMING,
-            callbacks=[langfuse_handler]
-        )
-        
-        # Bind tools to enable function calling
-        llm_with_tools = llm.bind_tools(tools=tools)
-        return llm_with_tools
\ No newline at end of file
+            max_retries=AGENT_MAX_RETRIES,
+            callbacks=callbacks,
+            cache=get_response_cache(AGENT_TEMPERATURE)
+        )
\ No newline at end of file
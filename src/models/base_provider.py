@@ -1,9 +1,72 @@
 """Abstract base class for LLM providers."""
 
+import hashlib
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Any, Dict, List, Optional, Tuple
+from langchain_core.caches import BaseCache, InMemoryCache, RETURN_VAL_TYPE
 from langchain_core.tools import BaseTool
 from langchain_core.language_models import BaseChatModel
+from langchain_core.runnables import Runnable
+from langchain_core.utils.function_calling import convert_to_openai_tool
+
+from src.config.parameters import AGENT_RESPONSE_CACHE, AGENT_RESPONSE_CACHE_SIZE
+
+
+class DigestKeyedCache(InMemoryCache):
+    """In-memory LLM cache keyed on a BLAKE2b digest of the prompt and LLM string.
+    
+    Chat prompts hold the serialized message history and the LLM string holds
+    every bound tool schema, so keying on digests keeps each entry's key at
+    32 characters instead of tens of kilobytes.
+    """
+    
+    @staticmethod
+    def _digest(prompt: str, llm_string: str) -> str:
+        hasher = hashlib.blake2b(prompt.encode(), digest_size=16)
+        hasher.update(b"\0")
+        hasher.update(llm_string.encode())
+        return hasher.hexdigest()
+    
+    def lookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
+        return super().lookup(self._digest(prompt, llm_string), "")
+    
+    def update(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
+        super().update(self._digest(prompt, llm_string), "", return_val)
+
+
+# Global response cache instance, shared by all providers
+_response_cache: Optional[BaseCache] = None
+
+
+def get_response_cache(temperature: float = 0.0) -> Optional[BaseCache]:
+    """Get the shared LLM response cache, or None if caching is disabled or the model samples."""
+    global _response_cache
+    if not AGENT_RESPONSE_CACHE or temperature > 0:
+        return None
+    if _response_cache is None:
+        _response_cache = DigestKeyedCache(maxsize=AGENT_RESPONSE_CACHE_SIZE)
+    return _response_cache
+
+
+# OpenAI-format tool schemas keyed on id(tool), each stored with its tool so a
+# recycled id() can never match a different tool
+_tool_schemas: Dict[int, Tuple[BaseTool, Dict[str, Any]]] = {}
+
+
+def get_tool_schemas(tools: List[BaseTool]) -> List[Dict[str, Any]]:
+    """Get OpenAI-format schemas for tools, converting each tool only once.
+    
+    ``bind_tools`` passes already converted schemas through unchanged, so
+    binding these skips the per-tool JSON schema conversion.
+    """
+    schemas = []
+    for tool in tools:
+        cached = _tool_schemas.get(id(tool))
+        if cached is None or cached[0] is not tool:
+            cached = (tool, convert_to_openai_tool(tool))
+            _tool_schemas[id(tool)] = cached
+        schemas.append(cached[1])
+    return schemas
 
 
 class BaseLLMProvider(ABC):
@@ -43,6 +106,31 @@ class BaseLLMProvider(ABC):
         Returns:
             Configured LLM instance with bound tools
             
+        Raises:
+            Exception: If configuration is invalid or connection fails
+        """
+        pass
+    
+    @abstractmethod
+    def create_tool_llm(
+        self,
+        model_name: str,
+        tools: List[BaseTool],
+        **kwargs
+    ) -> Runnable:
+        """Create LLM instance with tools bound but no tracking callbacks.
+        
+        The result is independent of user/session/message, so it can be cached
+        and reused with per-call callbacks attached via ``with_config``.
+        
+        Args:
+            model_name: The specific model name (without provider prefix)
+            tools: List of tools to bind to the LLM for function calling
+            **kwargs: Additional provider-specific arguments
+            
+        Returns:
+            LLM instance with bound tools
+            
         Raises:
             Exception: If configuration is invalid or connection fails
         """
@@ -1,13 +1,15 @@
 """Ollama LLM provider implementation."""
 
 from typing import List, Optional
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.runnables import Runnable
 from langchain_core.tools import BaseTool
 from langchain_ollama import ChatOllama
 
 from src.config.settings import get_settings
 from src.config.parameters import AGENT_TEMPERATURE
 from src.services.langfuse_service import LangfuseService, get_langfuse_service
-from .base_provider import BaseLLMProvider
+from .base_provider import BaseLLMProvider, get_response_cache, get_tool_schemas
 
 
 class OllamaLLMProvider(BaseLLMProvider):
@@ -72,13 +74,35 @@ class OllamaLLMProvider(BaseLLMProvider):
         )
         
         # Create Ollama LLM instance
-        llm = ChatOllama(
-            base_url=self.settings.OLLAMA_ENDPOINT,
-            model=model_name,
-            temperature=AGENT_TEMPERATURE,
-            callbacks=[langfuse_handler]
-        )
+        llm = self._build_llm(model_name, callbacks=[langfuse_handler])
         
         # Bind tools to enable function calling
         llm_with_tools = llm.bind_tools(tools=tools)
-        return llm_with_tools
\ No newline at end of file
+        return llm_with_tools
+    
+    def create_tool_llm(self, model_name: str, tools: List[BaseTool], **kwargs) -> Runnable:
+        """Create Ollama LLM with tools bound but no tracking callbacks.
+        
+        Args:
+            model_name: The Ollama model name (e.g., "llama2", "mistral")
+            tools: List of tools to bind to the LLM for function calling
+            **kwargs: Additional Ollama-specific arguments
+            
+        Returns:
+            ChatOllama instance with bound tools
+        """
+        return self._build_llm(model_name).bind_tools(tools=get_tool_schemas(tools))
+    
+    def _build_llm(
+        self,
+        model_name: str,
+        callbacks: Optional[List[BaseCallbackHandler]] = None
+    ) -> ChatOllama:
+        """Construct the Ollama chat model."""
+        return ChatOllama(
+            base_url=self.settings.OLLAMA_ENDPOINT,
+            model=model_name,
+            temperature=AGENT_TEMPERATURE,
+            callbacks=callbacks,
+            cache=get_response_cache(AGENT_TEMPERATURE)
+        )
\ No newline at end of file
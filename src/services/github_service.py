@@ -1,16 +1,52 @@
 """
 High-level GitHub service using the agent for operations
 """
-import uuid
-from typing import Optional
-from src.agents.github_agent import GitHubAgent, create_github_agent
+from __future__ import annotations
+import asyncio
+import functools
+import itertools
+import json
+import os
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Tuple
+from src.agents.github_agent import GitHubAgent, create_github_agent, ERROR_RESPONSE_PREFIX
+from src.tools.github_tools import get_github_tool
 from src.utils.session_context import get_session_context
 from src.config.parameters import (
     DEFAULT_PR_LIMIT,
     DEFAULT_COMMIT_LIMIT,
-    DEFAULT_BRANCH
+    DEFAULT_BRANCH,
+    SERVICE_CACHE_TTL,
+    SERVICE_CACHE_SIZE,
+    SERVICE_BATCH_CONCURRENCY
 )
-from src.utils.prompt_loader import get_prompt_loader
+from src.utils.prompt_loader import compile_template, get_prompt_loader
+
+# Service message IDs only need to be unique within this process, so a
+# PID-prefixed counter is used instead of generating a uuid4 per question
+_message_ids = itertools.count()
+_pid = os.getpid()
+
+
+# Sections of the get_repository_overview result, as named in the overview prompt
+OVERVIEW_SECTIONS = ("branches", "repository_info", "pull_requests", "commits")
+
+
+def _parse_overview(answer: str) -> Dict[str, Optional[str]]:
+    """Split an overview answer into its sections, tolerating text around the JSON object"""
+    try:
+        data = json.loads(answer[answer.index("{"):answer.rindex("}") + 1])
+    except ValueError:
+        data = {}
+    if not isinstance(data, dict):
+        data = {}
+    
+    overview: Dict[str, Optional[str]] = {}
+    for section in OVERVIEW_SECTIONS:
+        value = data.get(section)
+        overview[section] = value if value is None or isinstance(value, str) else json.dumps(value)
+    overview["raw"] = answer
+    return overview
 
 
 class GitHubService:
@@ -18,56 +54,140 @@ class GitHubService:
     
     def __init__(self):
         self.agent: Optional[GitHubAgent] = None
+        # Answers and tool results by cache key, as (expiry time, result), oldest first
+        self._cache: Dict[Hashable, Tuple[float, str]] = {}
+        # Upstream calls in progress by cache key, shared by concurrent callers
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+        self._agent_lock = asyncio.Lock()
         
+    @functools.cached_property
+    def _render(self) -> Dict[str, Callable[..., str]]:
+        """Query template renderers by type, parsed from the prompt loader once per service"""
+        prompt_loader = get_prompt_loader()
+        return {
+            query_type: compile_template(prompt_loader.get_query_template(query_type))
+            for query_type in (
+                "branches", "repository_info", "pull_requests", "pull_request_summary",
+                "commits", "search_repos", "file_content", "overview"
+            )
+        }
+    
     async def _get_agent(self) -> GitHubAgent:
         """Get or create the GitHub agent"""
-        if self.agent is None:
-            # Use shared session parameters from main.py for consistent tracing
-            session_context = get_session_context()
-            user_id, session_id, trace_id, llm_model_name = session_context.get_session_parameters()
-            
-            # Use service-specific user_id but keep same session/trace for consistency
-            service_user_id = "service_user"
-            self.agent = await create_github_agent(service_user_id, session_id, trace_id, llm_model_name)
+        if self.agent is not None:
+            return self.agent
+        
+        async with self._agent_lock:
+            # Another caller may have created it while we waited for the lock
+            if self.agent is None:
+                # Use shared session parameters from main.py for consistent tracing
+                _, session_id, trace_id, llm_model_name = get_session_context().get_session_parameters()
+                
+                # Use service-specific user_id but keep same session/trace for consistency
+                service_user_id = "service_user"
+                # Questions are one-shot and answered independently, no conversation to keep
+                self.agent = await create_github_agent(
+                    service_user_id, session_id, trace_id, llm_model_name, conversation_memory=False
+                )
         return self.agent
     
-    async def ask_question(self, question: str) -> str:
-        """Ask a question about GitHub repositories"""
+    async def ask_question(self, question: str, cache_key: Optional[Hashable] = None) -> str:
+        """Ask a question about GitHub repositories
+        
+        Answers are reused for SERVICE_CACHE_TTL seconds, and concurrent calls
+        with the same question share one agent invocation. Each question runs as
+        its own conversation, so an answer depends only on the question text.
+        
+        Methods that render a question from a template pass the template type
+        and parameters as cache_key, which is cheaper to hash than the rendered
+        text. Free-form questions are keyed by their text.
+        """
+        key = question if cache_key is None else cache_key
+        return await self._cached(key, lambda: self._fetch_answer(question, key))
+    
+    async def _cached(self, key: Hashable, fetch: Callable[[], Awaitable[str]]) -> str:
+        """Return the cached result for key, or fetch it once for all concurrent callers"""
+        cached = self._cache.get(key)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+        
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fetch())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        
+        # Shielded so one caller giving up doesn't cancel the call for the others
+        return await asyncio.shield(task)
+    
+    async def _fetch_answer(self, question: str, key: Hashable) -> str:
+        """Ask the agent and cache the answer"""
         agent = await self._get_agent()
-        message_id = str(uuid.uuid4())
-        return await agent.ainvoke(question, message_id)
+        message_id = f"{_pid}-{next(_message_ids)}"
+        answer = await agent.ainvoke(question, message_id)
+        
+        # The agent reports failures as text, don't keep those around
+        if not answer.startswith(ERROR_RESPONSE_PREFIX):
+            self._store(key, answer)
+        return answer
+    
+    async def call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> str:
+        """Call a GitHub MCP tool directly, without the LLM
+        
+        Results are cached and coalesced like ask_question answers.
+        
+        Raises:
+            ValueError: If the GitHub MCP server has no tool with this name
+        """
+        key = ("tool", tool_name, json.dumps(arguments, sort_keys=True))
+        
+        async def fetch() -> str:
+            tool = await get_github_tool(tool_name)
+            if tool is None:
+                raise ValueError(f"GitHub tool not available: {tool_name}")
+            result = await tool.ainvoke(arguments)
+            self._store(key, result)
+            return result
+        
+        return await self._cached(key, fetch)
+    
+    def _store(self, key: Hashable, value: str) -> None:
+        """Cache a result, evicting the oldest entry when full"""
+        self._cache.pop(key, None)
+        if len(self._cache) >= SERVICE_CACHE_SIZE:
+            del self._cache[next(iter(self._cache))]
+        self._cache[key] = (time.monotonic() + SERVICE_CACHE_TTL, value)
     
     async def get_repository_branches(self, owner: str, repo: str) -> str:
         """Get branches for a specific repository"""
-        prompt_loader = get_prompt_loader()
-        question = prompt_loader.get_query_template("branches").format(owner=owner, repo=repo)
-        return await self.ask_question(question)
+        question = self._render["branches"](owner=owner, repo=repo)
+        return await self.ask_question(question, cache_key=("branches", owner, repo))
+    
+    async def get_repository_branches_raw(self, owner: str, repo: str) -> str:
+        """Get the raw branch listing for a repository from the MCP server, skipping the LLM"""
+        return await self.call_tool("list_branches", {"owner": owner, "repo": repo})
     
     async def get_repository_info(self, owner: str, repo: str) -> str:
         """Get information about a repository"""
-        prompt_loader = get_prompt_loader()
-        question = prompt_loader.get_query_template("repository_info").format(owner=owner, repo=repo)
-        return await self.ask_question(question)
+        question = self._render["repository_info"](owner=owner, repo=repo)
+        return await self.ask_question(question, cache_key=("repository_info", owner, repo))
     
     async def get_latest_pull_requests(self, owner: str, repo: str, limit: int = 5) -> str:
         """Get latest pull requests for a repository"""
         limit = limit or DEFAULT_PR_LIMIT
-        prompt_loader = get_prompt_loader()
-        question = prompt_loader.get_query_template("pull_requests").format(owner=owner, repo=repo, limit=limit)
-        return await self.ask_question(question)
+        question = self._render["pull_requests"](owner=owner, repo=repo, limit=limit)
+        return await self.ask_question(question, cache_key=("pull_requests", owner, repo, limit))
     
     async def summarize_pull_request(self, owner: str, repo: str, pr_number: int) -> str:
         """Get detailed summary of a specific pull request"""
-        prompt_loader = get_prompt_loader()
-        question = prompt_loader.get_query_template("pull_request_summary").format(owner=owner, repo=repo, pr_number=pr_number)
-        return await self.ask_question(question)
+        question = self._render["pull_request_summary"](owner=owner, repo=repo, pr_number=pr_number)
+        return await self.ask_question(question, cache_key=("pull_request_summary", owner, repo, pr_number))
     
     async def get_recent_commits(self, owner: str, repo: str, limit: int = 10) -> str:
         """Get recent commits for a repository"""
         limit = limit or DEFAULT_COMMIT_LIMIT
-        prompt_loader = get_prompt_loader()
-        question = prompt_loader.get_query_template("commits").format(owner=owner, repo=repo, limit=limit)
-        return await self.ask_question(question)
+        question = self._render["commits"](owner=owner, repo=repo, limit=limit)
+        return await self.ask_question(question, cache_key=("commits", owner, repo, limit))
     
     async def get_latest_commits(self, owner: str, repo: str, limit: int = 10) -> str:
         """Get latest commits for a repository (alias for get_recent_commits)"""
@@ -76,33 +196,82 @@ class GitHubService:
     async def search_repositories(self, query: str, limit: int = 10) -> str:
         """Search for repositories"""
         limit = limit or DEFAULT_PR_LIMIT
-        prompt_loader = get_prompt_loader()
-        question = prompt_loader.get_query_template("search_repos").format(query=query, limit=limit)
-        return await self.ask_question(question)
+        question = self._render["search_repos"](query=query, limit=limit)
+        return await self.ask_question(question, cache_key=("search_repos", query, limit))
     
     async def get_file_content(self, owner: str, repo: str, file_path: str, ref: str = "main") -> str:
         """Get content of a specific file"""
         ref = ref or DEFAULT_BRANCH
-        prompt_loader = get_prompt_loader()
-        question = prompt_loader.get_query_template("file_content").format(owner=owner, repo=repo, file_path=file_path, ref=ref)
-        return await self.ask_question(question)
+        question = self._render["file_content"](owner=owner, repo=repo, file_path=file_path, ref=ref)
+        return await self.ask_question(question, cache_key=("file_content", owner, repo, file_path, ref))
+    
+    async def get_repository_overview(
+        self, owner: str, repo: str, pr_limit: int = 5, commit_limit: int = 10
+    ) -> Dict[str, Optional[str]]:
+        """Get branches, information, pull requests and commits for a repository in one question
+        
+        Replaces separate get_repository_branches, get_repository_info,
+        get_latest_pull_requests and get_recent_commits calls with a single
+        agent round-trip. Returns a dict with the keys in OVERVIEW_SECTIONS,
+        plus "raw" holding the agent's full reply. A section the reply doesn't
+        provide as JSON is None.
+        """
+        pr_limit = pr_limit or DEFAULT_PR_LIMIT
+        commit_limit = commit_limit or DEFAULT_COMMIT_LIMIT
+        question = self._render["overview"](
+            owner=owner, repo=repo, pr_limit=pr_limit, commit_limit=commit_limit
+        )
+        answer = await self.ask_question(
+            question, cache_key=("overview", owner, repo, pr_limit, commit_limit)
+        )
+        return _parse_overview(answer)
     
     async def get_user_info(self) -> str:
         """Get information about the authenticated user"""
-        return await self.ask_question("Who am I on GitHub?")
+        return await self.ask_question("Who am I on GitHub?", cache_key=("user_info",))
     
     async def list_repositories(self, username: str) -> str:
         """List repositories for a specific user"""
-        return await self.ask_question(f"What repositories does {username} have?")
-
-
-# Singleton instance
-_github_service: Optional[GitHubService] = None
+        return await self.ask_question(
+            f"What repositories does {username} have?", cache_key=("user_repositories", username)
+        )
+    
+    async def _gather_repos(
+        self,
+        method: Callable[..., Awaitable[str]],
+        repos: List[Tuple[str, str]],
+        concurrency: int,
+        *args
+    ) -> List[str]:
+        """Call a per-repository method for each (owner, repo) with bounded concurrency"""
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def call_one(owner: str, repo: str) -> str:
+            async with semaphore:
+                return await method(owner, repo, *args)
+        
+        return await asyncio.gather(*(call_one(owner, repo) for owner, repo in repos))
+    
+    async def get_many_repository_infos(
+        self, repos: List[Tuple[str, str]], concurrency: int = SERVICE_BATCH_CONCURRENCY
+    ) -> List[str]:
+        """Get information about several repositories concurrently, in input order"""
+        return await self._gather_repos(self.get_repository_info, repos, concurrency)
+    
+    async def get_many_branches(
+        self, repos: List[Tuple[str, str]], concurrency: int = SERVICE_BATCH_CONCURRENCY
+    ) -> List[str]:
+        """Get branches for several repositories concurrently, in input order"""
+        return await self._gather_repos(self.get_repository_branches, repos, concurrency)
+    
+    async def get_many_recent_commits(
+        self, repos: List[Tuple[str, str]], limit: int = 10, concurrency: int = SERVICE_BATCH_CONCURRENCY
+    ) -> List[str]:
+        """Get recent commits for several repositories concurrently, in input order"""
+        return await self._gather_repos(self.get_recent_commits, repos, concurrency, limit)
 
 
-async def get_github_service() -> GitHubService:
+@functools.cache
+def get_github_service() -> GitHubService:
     """Get the GitHub service singleton"""
-    global _github_service
-    if _github_service is None:
-        _github_service = GitHubService()
-    return _github_service
\ No newline at end of file
+    return GitHubService()
\ No newline at end of file
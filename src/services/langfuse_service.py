@@ -8,18 +8,22 @@ This service centralizes all Langfuse functionality, including:
 - Configuration validation
 """
 
+from __future__ import annotations
+
 import uuid
 import logging
 import contextlib
+import functools
 from typing import Optional, Dict, Any, List, Tuple
 from dataclasses import dataclass
+from langfuse import Langfuse
 from langfuse.callback import CallbackHandler
 
 from src.config.settings import Settings, get_settings
 
 logger = logging.getLogger("langfuse")
 
-@dataclass
+@dataclass(slots=True)
 class CallbackConfig:
     """Configuration for callback handler creation."""
     provider: str
@@ -35,10 +39,35 @@ class CallbackFactory:
     
     def __init__(self, settings: Settings):
         self.settings = settings
+        self._client: Optional[Langfuse] = None
+        # Fixed metadata fields by (provider, model_name)
+        self._base_metadata: Dict[Tuple[str, str], Dict[str, str]] = {}
+    
+    def get_client(self) -> Langfuse:
+        """Get the Langfuse client shared by all handlers from this factory.
+        
+        The client owns the HTTP connection pool and background flush
+        threads, so it is created once instead of once per handler.
+        
+        Returns:
+            Shared Langfuse client
+        """
+        if self._client is None:
+            self._client = Langfuse(
+                secret_key=self.settings.LANGFUSE_SECRET_KEY,
+                public_key=self.settings.LANGFUSE_PUBLIC_KEY,
+                host=self.settings.LANGFUSE_HOST,
+                sdk_integration="langchain"
+            )
+        return self._client
         
     def create_handler(self, config: CallbackConfig) -> CallbackHandler:
         """Create a configured Langfuse callback handler.
         
+        Each handler records into its own trace on the shared client, so
+        creating one per message is cheap and concurrent messages never
+        share handler state.
+        
         Args:
             config: Callback configuration parameters
             
@@ -49,12 +78,17 @@ class CallbackFactory:
             ValueError: If required configuration is missing
         """
         # Prepare metadata with standard fields
+        base = self._base_metadata.get((config.provider, config.model_name))
+        if base is None:
+            base = self._base_metadata[(config.provider, config.model_name)] = {
+                "llm_model_name": f"{config.provider}:{config.model_name}",
+                "provider": config.provider
+            }
         metadata = {
-            "llm_model_name": f"{config.provider}:{config.model_name}",
+            **base,
             "message_id": config.message_id,
             "session_id": config.session_id,
-            "trace_id": config.trace_id,
-            "provider": config.provider
+            "trace_id": config.trace_id
         }
         
         # Add any custom metadata
@@ -62,10 +96,15 @@ class CallbackFactory:
             metadata.update(config.metadata)
             
         try:
+            trace = self.get_client().trace(
+                name=metadata["llm_model_name"],
+                session_id=config.session_id,
+                user_id=config.user_id,
+                metadata=metadata
+            )
             return CallbackHandler(
-                secret_key=self.settings.LANGFUSE_SECRET_KEY,
-                public_key=self.settings.LANGFUSE_PUBLIC_KEY,
-                host=self.settings.LANGFUSE_HOST,
+                stateful_client=trace,
+                update_stateful_client=True,
                 session_id=config.session_id,
                 user_id=config.user_id,
                 metadata=metadata
@@ -80,10 +119,20 @@ class TraceManager:
     def __init__(self, settings: Settings):
         self.settings = settings
         
-    @contextlib.contextmanager
-    def trace_context(self, name: str, user_id: str, session_id: str):
+    def new_trace_id(self) -> str:
+        """Generate an identifier for a new trace.
+        
+        Returns:
+            str: New trace ID
+        """
+        return str(uuid.uuid4())
+        
+    def trace_context(self, name: str, user_id: str, session_id: str) -> contextlib.AbstractContextManager[str]:
         """Context manager for automatic trace management.
         
+        Traces currently need no cleanup, so this is a plain nullcontext
+        around new_trace_id().
+        
         Args:
             name: Name of the trace
             user_id: User identifier
@@ -92,12 +141,7 @@ class TraceManager:
         Yields:
             str: Trace ID for the created trace
         """
-        try:
-            trace_id = str(uuid.uuid4())
-            yield trace_id
-        finally:
-            # In the future, we can add trace cleanup or finalization here
-            pass
+        return contextlib.nullcontext(self.new_trace_id())
             
     def get_trace_url(self, trace_id: str) -> str:
         """Get the Langfuse UI URL for a trace.
@@ -162,6 +206,8 @@ class LangfuseService:
         self.trace_manager = TraceManager(self.settings)
         self.metrics_collector = MetricsCollector(self.settings)
         self.session_manager = SessionManager(self.settings)
+        # Last health status, with the settings values it was built from
+        self._health_status: Optional[Tuple[Tuple[Any, ...], Dict[str, Any]]] = None
         
     def create_callback_handler(
         self,
@@ -221,28 +267,30 @@ class LangfuseService:
     def get_health_status(self) -> Dict[str, Any]:
         """Get Langfuse service health status.
         
+        The status is built once and reused until the Langfuse settings
+        change, so frequent health checks don't rebuild it. Callers must
+        not modify the returned dict.
+        
         Returns:
             Dict containing service health information
         """
-        is_valid, missing = self.validate_configuration()
-        return {
-            "configured": is_valid,
-            "missing_variables": missing,
-            "host": self.settings.LANGFUSE_HOST,
-            "has_secret_key": bool(self.settings.LANGFUSE_SECRET_KEY),
-            "has_public_key": bool(self.settings.LANGFUSE_PUBLIC_KEY)
-        }
-
-# Global service instance
-_langfuse_service = None
+        key = (self.settings.LANGFUSE_SECRET_KEY, self.settings.LANGFUSE_PUBLIC_KEY, self.settings.LANGFUSE_HOST)
+        if self._health_status is None or self._health_status[0] != key:
+            is_valid, missing = self.validate_configuration()
+            self._health_status = (key, {
+                "configured": is_valid,
+                "missing_variables": missing,
+                "host": self.settings.LANGFUSE_HOST,
+                "has_secret_key": bool(self.settings.LANGFUSE_SECRET_KEY),
+                "has_public_key": bool(self.settings.LANGFUSE_PUBLIC_KEY)
+            })
+        return self._health_status[1]
 
+@functools.cache
 def get_langfuse_service() -> LangfuseService:
     """Get or create the global LangfuseService instance.
     
     Returns:
         Global LangfuseService singleton
     """
-    global _langfuse_service
-    if _langfuse_service is None:
-        _langfuse_service = LangfuseService()
-    return _langfuse_service
\ No newline at end of file
+    return LangfuseService()
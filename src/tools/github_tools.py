@@ -1,14 +1,48 @@
 """
 Simplified GitHub tools using langchain-mcp-adapters with GitHub-specific MCP client
 """
+import asyncio
+import bisect
+import json
 import logging
-from typing import List, Optional
-from langchain_core.tools import BaseTool
-from src.tools.mcp_client.github_client import GitHubMCPClient
+from typing import Any, Dict, List, Optional, Tuple
+from langchain_core.tools import BaseTool, StructuredTool
+from src.config.parameters import AGENT_WARM_START
+from src.tools.mcp_client.github_client import cleanup_global_client, get_global_github_client
+from src.utils.event_loop import run_in_background_loop
 
 # Setup logging configuration for MCP adapters
 logging.getLogger("langchain_mcp_adapters").setLevel(logging.WARNING)
 
+# Process-wide tool discovery, shared by every agent and concurrent caller
+_tools_task: Optional[asyncio.Task] = None
+
+# Indexes of the discovered tool list they were built from: tools by name,
+# and tool names with their tools sorted by name. See _get_tool_index
+_tool_index: Tuple[Optional[List[BaseTool]], Dict[str, BaseTool], List[str], List[BaseTool]] = (None, {}, [], [])
+
+
+def _add_sync_entry(tool: BaseTool) -> None:
+    """Let an async-only MCP tool also be invoked synchronously.
+    
+    Sync calls run the tool's coroutine on the shared background event loop.
+    That is the loop PersistentSession does all its MCP I/O on, so sync and
+    async calls share one server session and its caches are only used from
+    that loop's thread.
+    """
+    if isinstance(tool, StructuredTool) and tool.func is None and tool.coroutine is not None:
+        coroutine = tool.coroutine
+        tool.func = lambda **kwargs: run_in_background_loop(coroutine(**kwargs))
+
+
+async def _discover_github_tools() -> List[BaseTool]:
+    """Run MCP tool discovery against the GitHub server."""
+    client = await get_global_github_client()
+    tools = await client.get_tools()
+    for tool in tools:
+        _add_sync_entry(tool)
+    return tools
+
 
 async def get_github_tools() -> List[BaseTool]:
     """
@@ -18,11 +52,177 @@ async def get_github_tools() -> List[BaseTool]:
     that dynamically discovers and converts all available tools from the
     GitHub MCP server using langchain-mcp-adapters.
     
+    Discovery runs once per process; concurrent callers await the same
+    in-flight task and later callers get the same tool list. A failed
+    discovery is retried on the next call.
+    
     Returns:
         List[BaseTool]: All available GitHub tools as LangChain tools
     """
-    client = GitHubMCPClient()
-    return await client.get_tools()
+    global _tools_task
+    
+    task = _tools_task
+    if task is None or (
+        task.done() and (task.cancelled() or task.exception() is not None)
+    ) or (
+        # A pending task from an event loop that is gone can never complete
+        not task.done() and task.get_loop() is not asyncio.get_running_loop()
+    ):
+        task = _tools_task = asyncio.ensure_future(_discover_github_tools())
+    
+    return await task
+
+
+async def _get_tool_index() -> Tuple[Optional[List[BaseTool]], Dict[str, BaseTool], List[str], List[BaseTool]]:
+    """Get the indexes of the discovered tools, building them once per tool list"""
+    global _tool_index
+    tools = await get_github_tools()
+    if _tool_index[0] is not tools:
+        sorted_tools = sorted(tools, key=lambda tool: tool.name)
+        _tool_index = (
+            tools,
+            {tool.name: tool for tool in reversed(tools)},
+            [tool.name for tool in sorted_tools],
+            sorted_tools
+        )
+    return _tool_index
+
+
+async def get_github_tool(tool_name: str) -> Optional[BaseTool]:
+    """
+    Get a GitHub tool by name.
+    
+    The name index is built once per discovered tool list, so lookups don't
+    scan the tools.
+    
+    Returns:
+        Optional[BaseTool]: The tool, or None if the server has no tool with this name
+    """
+    _, tools_by_name, _, _ = await _get_tool_index()
+    return tools_by_name.get(tool_name)
+
+
+def warm_start() -> None:
+    """
+    Start GitHub tool discovery in the background when AGENT_WARM_START is set.
+    
+    Called by main.py once the environment is checked. Discovery only starts
+    if an event loop is running, so the MCP handshake overlaps with startup
+    instead of delaying the first question.
+    """
+    global _tools_task
+    if not AGENT_WARM_START or _tools_task is not None:
+        return
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    _tools_task = asyncio.ensure_future(_discover_github_tools())
+
+
+def invalidate_tools_cache() -> None:
+    """
+    Forget the discovered tools, so the next get_github_tools() call runs
+    discovery again.
+    """
+    global _tools_task
+    _tools_task = None
+
+
+async def cleanup_github_tools() -> None:
+    """
+    Close the GitHub MCP server session used by the tools.
+    
+    The next get_github_tools() call discovers the tools again on a new
+    session.
+    """
+    invalidate_tools_cache()
+    await cleanup_global_client()
+
+
+async def call_github_tools(calls: List[Tuple[str, Dict[str, Any]]]) -> List[Any]:
+    """
+    Call several GitHub tools concurrently.
+    
+    All calls go over the shared MCP session, so N lookups take about as long
+    as the slowest one rather than the sum of all of them. A failing call
+    doesn't affect the others.
+    
+    Args:
+        calls: (tool name, arguments) pairs
+    
+    Returns:
+        List[Any]: Each call's result, or the exception it raised, in input order
+    """
+    async def call_one(tool_name: str, arguments: Dict[str, Any]) -> Any:
+        tool = await get_github_tool(tool_name)
+        if tool is None:
+            raise ValueError(f"GitHub tool not available: {tool_name}")
+        return await tool.ainvoke(arguments)
+    
+    return await asyncio.gather(
+        *(call_one(tool_name, arguments) for tool_name, arguments in calls),
+        return_exceptions=True
+    )
+
+
+async def list_all_pages(
+    tool_name: str,
+    arguments: Dict[str, Any],
+    per_page: int = 100,
+    max_pages: int = 10,
+    prefetch: int = 4
+) -> List[Any]:
+    """
+    Collect every page of a paginated GitHub list tool such as list_commits.
+    
+    The MCP tools return a JSON array per page without a total count. After
+    a full first page, the next `prefetch` pages are fetched concurrently,
+    and this repeats until a page comes back short or max_pages is reached.
+    
+    Args:
+        tool_name: Name of a list tool that takes page and perPage arguments
+        arguments: Tool arguments other than page and perPage
+        per_page: Items requested per page (GitHub allows at most 100)
+        max_pages: Maximum number of pages to fetch
+        prefetch: Number of pages requested at once after the first page
+    
+    Returns:
+        List[Any]: Items from all pages, in page order
+    
+    Raises:
+        ValueError: If the tool is not available or a page is not a JSON array
+    """
+    tool = await get_github_tool(tool_name)
+    if tool is None:
+        raise ValueError(f"GitHub tool not available: {tool_name}")
+    
+    async def fetch(page: int) -> List[Any]:
+        content = await tool.ainvoke({**arguments, "page": page, "perPage": per_page})
+        # Tools with several text blocks in their result return a list of strings
+        if isinstance(content, list) and all(isinstance(part, str) for part in content):
+            content = "".join(content)
+        if not isinstance(content, str):
+            raise ValueError(f"{tool_name} returned {type(content).__name__} content for page {page}")
+        try:
+            items = json.loads(content)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"{tool_name} returned invalid JSON for page {page}: {e}") from e
+        if not isinstance(items, list):
+            raise ValueError(f"{tool_name} did not return a list for page {page}")
+        return items
+    
+    items = await fetch(1)
+    next_page, last_page_full = 2, len(items) >= per_page
+    while last_page_full and next_page <= max_pages:
+        pages = range(next_page, min(next_page + prefetch, max_pages + 1))
+        for page_items in await asyncio.gather(*(fetch(page) for page in pages)):
+            items.extend(page_items)
+            last_page_full = len(page_items) >= per_page
+            if not last_page_full:
+                break
+        next_page = pages.stop
+    return items
 
 
 # Backward compatibility function if needed
@@ -40,10 +240,15 @@ async def get_github_tools_by_prefix(prefix: str) -> List[BaseTool]:
         prefix: The prefix to filter tools by (e.g., "list_", "get_", "search_")
     
     Returns:
-        List[BaseTool]: Filtered GitHub tools
+        List[BaseTool]: Filtered GitHub tools, sorted by name
     """
-    all_tools = await get_github_tools()
-    return [tool for tool in all_tools if tool.name.startswith(prefix)]
+    _, _, names, tools = await _get_tool_index()
+    
+    # Names with the prefix sort between the prefix itself and the prefix
+    # with its last character incremented
+    start = bisect.bisect_left(names, prefix)
+    end = bisect.bisect_left(names, prefix[:-1] + chr(ord(prefix[-1]) + 1), start) if prefix else len(names)
+    return tools[start:end]
 
 
 async def get_available_tool_names() -> List[str]:
@@ -54,4 +259,4 @@ async def get_available_tool_names() -> List[str]:
         List[str]: Names of all available tools
     """
     tools = await get_github_tools()
-    return [tool.name for tool in tools]
\ No newline at end of file
+    return [tool.name for tool in tools]
@@ -18,6 +18,11 @@ from .github_client import (
     cleanup_global_client
 )
 
+from .daemon import (
+    MCPClientDaemon,
+    request_tools
+)
+
 __all__ = [
     # Generic MCP Client
     "MCPClient",
@@ -32,5 +37,9 @@ __all__ = [
     "GitHubMCPClientManager",
     "PersistentGitHubMCPClient",
     "get_global_github_client",
-    "cleanup_global_client"
+    "cleanup_global_client",
+    
+    # Tool listing daemon
+    "MCPClientDaemon",
+    "request_tools"
 ]
\ No newline at end of file
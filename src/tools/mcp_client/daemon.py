@@ -0,0 +1,138 @@
+"""
+Long-lived MCP client daemon serving tool listings over a Unix domain socket
+"""
+import os
+import json
+import asyncio
+import logging
+from typing import Any, List, Optional
+
+from .mcp_client import MCPClient
+
+
+def _default_socket_path() -> str:
+    """Socket path in a directory only the current user can access
+    
+    Uses $XDG_RUNTIME_DIR when set, otherwise a directory under ~/.cache that
+    the daemon creates with mode 0700.
+    """
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return os.path.join(runtime_dir, "mcp_tool_list.sock")
+    return os.path.join(os.path.expanduser("~"), ".cache", "mcp_daemon", "mcp_tool_list.sock")
+
+
+DEFAULT_SOCKET_PATH = _default_socket_path()
+
+# Tool listings with full schemas can be large, allow long response lines.
+# Responses are written without whitespace between tokens to keep them small.
+_STREAM_LIMIT = 1 << 24
+
+logger = logging.getLogger(__name__)
+
+
+def serialize_tool(tool: Any) -> List[Any]:
+    """Convert a tool to a JSON-friendly [name, description, schema] entry"""
+    schema = getattr(tool, "args_schema", None)
+    if hasattr(schema, "model_json_schema"):
+        # Pydantic models are not serializable as-is, use their JSON schema
+        schema = schema.model_json_schema()
+    return [tool.name, tool.description, schema]
+
+
+class MCPClientDaemon:
+    """Serves requests from a single MCP client kept alive for the daemon's lifetime"""
+
+    def __init__(self, socket_path: str = DEFAULT_SOCKET_PATH, config_path: Optional[str] = None):
+        self.socket_path = socket_path
+        self.client = MCPClient(config_path)
+
+    async def _handle_request(self, request: dict) -> dict:
+        """Dispatch a single request to the shared client"""
+        op = request.get("op")
+        if op == "list_tools":
+            tools = await self.client.get_tools(request.get("server"))
+            return {"tools": [serialize_tool(tool) for tool in tools]}
+        return {"error": f"Unknown operation: {op}"}
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Read one JSON request line and write one JSON response line"""
+        try:
+            request = json.loads(await reader.readline())
+            response = await self._handle_request(request)
+        except Exception as e:
+            logger.error(f"Daemon request failed: {e}")
+            response = {"error": str(e)}
+
+        try:
+            writer.write(json.dumps(response, default=str, separators=(",", ":")).encode() + b"\n")
+            await writer.drain()
+        finally:
+            writer.close()
+            await writer.wait_closed()
+
+    async def serve_forever(self):
+        """Start the MCP client and serve requests until cancelled
+        
+        Raises:
+            RuntimeError: If another daemon is already listening on the socket
+        """
+        os.makedirs(os.path.dirname(self.socket_path), mode=0o700, exist_ok=True)
+        if await _is_listening(self.socket_path):
+            raise RuntimeError(f"An MCP daemon is already listening on {self.socket_path}")
+        if os.path.exists(self.socket_path):
+            # Left behind by a daemon that didn't shut down cleanly
+            os.unlink(self.socket_path)
+
+        try:
+            async with self.client:
+                server = await asyncio.start_unix_server(
+                    self._handle_connection, path=self.socket_path, limit=_STREAM_LIMIT
+                )
+                async with server:
+                    await server.serve_forever()
+        finally:
+            if os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)
+
+
+async def _is_listening(socket_path: str, timeout: float = 1.0) -> bool:
+    """Check whether a server accepts connections on the socket"""
+    try:
+        _, writer = await asyncio.wait_for(asyncio.open_unix_connection(socket_path), timeout)
+    except (OSError, asyncio.TimeoutError):
+        return False
+    writer.close()
+    return True
+
+
+async def request_tools(
+    server_name: Optional[str] = None,
+    socket_path: str = DEFAULT_SOCKET_PATH,
+    timeout: float = 5.0
+) -> Optional[List[List[Any]]]:
+    """Ask a running daemon for tool entries.
+
+    Returns:
+        List of [name, description, schema] entries, or None if no daemon answered
+    """
+    try:
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_unix_connection(socket_path, limit=_STREAM_LIMIT), timeout
+        )
+    except (OSError, asyncio.TimeoutError):
+        return None
+
+    try:
+        writer.write(json.dumps({"op": "list_tools", "server": server_name}).encode() + b"\n")
+        await writer.drain()
+        response = json.loads(await asyncio.wait_for(reader.readline(), timeout))
+    except (OSError, ValueError, asyncio.TimeoutError):
+        return None
+    finally:
+        writer.close()
+
+    if "error" in response:
+        logger.warning(f"MCP daemon error: {response['error']}")
+        return None
+    return response.get("tools")
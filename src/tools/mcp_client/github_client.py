@@ -58,25 +58,39 @@ class GitHubMCPClientManager:
 
 
 class PersistentGitHubMCPClient:
-    """Simplified GitHub client that creates new connections per use"""
+    """Context manager for the process-wide GitHub MCP client"""
     
     def __init__(self, config_path: Optional[str] = None):
         self.config_path = config_path
     
     async def __aenter__(self) -> GitHubMCPClient:
-        return await create_github_client(self.config_path)
+        return await get_global_github_client(self.config_path)
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        # Each client manages its own cleanup
+        # The shared client stays open for other users, see cleanup_global_client
         pass
 
 
-# Backwards compatibility functions
+# GitHub MCP client shared by the whole process, so every tool call reuses its server session
+_global_client: Optional[GitHubMCPClient] = None
+
+
 async def get_global_github_client(config_path: Optional[str] = None) -> GitHubMCPClient:
-    """Create a new GitHub MCP client (no longer global)"""
-    return await create_github_client(config_path)
+    """Get the process-wide GitHub MCP client, creating it on first use
+    
+    config_path only applies to the call that creates the client.
+    """
+    global _global_client
+    if _global_client is None:
+        # Assigned before any await, so concurrent callers can't create a second client
+        _global_client = GitHubMCPClient(config_path)
+    await _global_client.start()
+    return _global_client
 
 
 async def cleanup_global_client():
-    """No-op for backwards compatibility"""
-    pass
+    """Stop the process-wide GitHub MCP client and close its server sessions"""
+    global _global_client
+    client, _global_client = _global_client, None
+    if client is not None:
+        await client.stop()
@@ -3,21 +3,260 @@ Generic MCP Client using langchain-mcp-adapters with registry-based configuratio
 """
 import os
 import json
+import asyncio
+import bisect
+import functools
+import hashlib
 import logging
+import random
+import re
+import time
+import warnings
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import Any, Coroutine, Dict, List, Optional, Set, Tuple, TypeVar
 from langchain_core.tools import BaseTool
 from langchain_mcp_adapters.client import MultiServerMCPClient
+from langchain_mcp_adapters.tools import load_mcp_tools
+from mcp import ClientSession
+from mcp.types import CallToolResult, ListToolsResult
 from src.config.settings import get_settings
+from src.utils.event_loop import get_background_loop
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Longest wait between retries of a rate-limited tool call, in seconds
+_MAX_RETRY_DELAY = 30.0
+
+# Environment variable names whose values are kept out of tools cache keys
+_SECRET_NAME = re.compile(r"TOKEN|SECRET|PASSWORD|KEY", re.IGNORECASE)
+
+# Configuration the logger levels were last set from, see MCPClient._setup_logging
+_logging_config: Optional[Dict[str, Any]] = None
+
+
+@functools.lru_cache(maxsize=8)
+def _read_config(config_path: str, mtime: float) -> Dict[str, Any]:
+    """Parse an MCP configuration file, once per path and modification time
+    
+    The result is shared by every client using the file, so it must not be modified.
+    """
+    with open(config_path, 'r') as f:
+        return json.load(f)
+
+
+def read_tools_cache(path: Optional[Path]) -> Optional[ListToolsResult]:
+    """Load a cached tool listing, or None if there is no usable one"""
+    if path is None:
+        return None
+    try:
+        return ListToolsResult.model_validate_json(path.read_bytes())
+    except (OSError, ValueError):
+        return None
+
+
+def _is_rate_limited(result: CallToolResult) -> bool:
+    """Check whether a tool call failed because the server hit a rate limit"""
+    return bool(result.isError) and any(
+        "rate limit" in getattr(content, "text", "").lower() for content in result.content
+    )
 
 
 class ToolInfo:
     """Simple tool info class for backward compatibility"""
+    # One is built per tool on every listing, so skip the per-instance __dict__
+    __slots__ = ("name", "description")
+    
     def __init__(self, name: str, description: str = ""):
         self.name = name
         self.description = description
 
 
+class PersistentSession:
+    """MCP session to one server that stays open between tool calls
+    
+    Stands in for a ClientSession when loading tools, so the tools reuse one
+    server connection instead of starting the server for every call. The
+    connection is opened on first use and reopened if it drops.
+    
+    A session is bound to the event loop that opened it, so all of its work
+    runs on the shared background loop (see get_background_loop), whichever
+    loop or thread the caller is on. This keeps one server connection per
+    process and means the caches below are only touched by one thread.
+    
+    At most max_concurrency tool calls run at once, and calls that fail on a
+    rate limit are retried up to rate_limit_retries times with exponential
+    backoff and jitter.
+    
+    Successful results of tools the server marks read-only are reused for
+    read_cache_ttl seconds, keeping at most read_cache_size results, and
+    concurrent identical read-only calls share one request. Calling any other
+    tool clears both, since it may change what reads return.
+    
+    With tools_cache set, the tool listing is read from that file when it
+    exists, so loading tools doesn't start the server. Otherwise the listing
+    is fetched from the server and written there for the next process.
+    """
+    
+    def __init__(
+        self,
+        client: MultiServerMCPClient,
+        server_name: str,
+        max_concurrency: int = 10,
+        rate_limit_retries: int = 5,
+        read_cache_ttl: float = 60,
+        read_cache_size: int = 256,
+        tools_cache: Optional[Path] = None
+    ):
+        self._client = client
+        self.server_name = server_name
+        self.max_concurrency = max_concurrency
+        self.rate_limit_retries = rate_limit_retries
+        self.read_cache_ttl = read_cache_ttl
+        self.read_cache_size = read_cache_size
+        self.tools_cache = tools_cache
+        # Names of tools annotated read-only, learned from list_tools
+        self._read_only: Set[str] = set()
+        # Read-only results by (tool name, arguments JSON), as (expiry time, result), oldest first
+        self._cache: Dict[Tuple[str, str], Tuple[float, CallToolResult]] = {}
+        # Read-only calls in progress by the same key, shared by concurrent callers
+        self._inflight: Dict[Tuple[str, str], asyncio.Task] = {}
+        # Bumped by every other tool call, so reads started before it aren't cached
+        self._writes = 0
+        self._limit = asyncio.Semaphore(max_concurrency)
+        self._task: Optional[asyncio.Task] = None
+        self._ready: Optional[asyncio.Future] = None
+        self._closing: Optional[asyncio.Event] = None
+    
+    async def _on_session_loop(self, coro: Coroutine[Any, Any, T]) -> T:
+        """Run a coroutine on the background loop that owns the session"""
+        loop = get_background_loop()
+        if asyncio.get_running_loop() is loop:
+            return await coro
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, loop))
+    
+    async def _get_session(self) -> ClientSession:
+        """Get the open session, connecting if needed. Runs on the background loop."""
+        if self._task is None or self._task.done():
+            loop = asyncio.get_running_loop()
+            self._ready = loop.create_future()
+            self._closing = asyncio.Event()
+            self._task = loop.create_task(self._hold(self._ready, self._closing))
+        return await asyncio.shield(self._ready)
+    
+    async def _hold(self, ready: asyncio.Future, closing: asyncio.Event):
+        """Open the session and keep it open until closing is set"""
+        try:
+            async with self._client.session(self.server_name) as session:
+                ready.set_result(session)
+                await closing.wait()
+        except asyncio.CancelledError:
+            if not ready.done():
+                ready.cancel()
+            raise
+        except Exception as e:
+            if not ready.done():
+                ready.set_exception(e)
+            else:
+                logger.warning(f"MCP session to '{self.server_name}' closed: {e}")
+    
+    async def list_tools(self, cursor: Optional[str] = None) -> ListToolsResult:
+        """List the server's tools, from the tools cache file if there is one"""
+        return await self._on_session_loop(self._list_tools(cursor))
+    
+    async def _list_tools(self, cursor: Optional[str]) -> ListToolsResult:
+        result = self._read_tools_cache() if cursor is None else None
+        if result is None:
+            session = await self._get_session()
+            result = await session.list_tools(cursor)
+            if cursor is None and result.nextCursor is None:
+                self._write_tools_cache(result)
+        self._read_only.update(
+            tool.name for tool in result.tools
+            if tool.annotations is not None and tool.annotations.readOnlyHint
+        )
+        return result
+    
+    def _read_tools_cache(self) -> Optional[ListToolsResult]:
+        """Load the cached tool listing, or None if there is no usable one"""
+        return read_tools_cache(self.tools_cache)
+    
+    def _write_tools_cache(self, result: ListToolsResult):
+        """Save the tool listing, replacing the cache file atomically"""
+        if self.tools_cache is None:
+            return
+        temp = self.tools_cache.with_name(f"{self.tools_cache.name}.{os.getpid()}.tmp")
+        try:
+            self.tools_cache.parent.mkdir(parents=True, exist_ok=True)
+            temp.write_text(result.model_dump_json(exclude_none=True))
+            os.replace(temp, self.tools_cache)
+        except OSError as e:
+            logger.warning(f"Could not cache the tool list of '{self.server_name}': {e}")
+    
+    async def call_tool(self, name: str, arguments: Optional[Dict[str, Any]] = None, **kwargs) -> CallToolResult:
+        """Call a tool over the open session, reusing recent read-only results"""
+        return await self._on_session_loop(self._call_tool(name, arguments, **kwargs))
+    
+    async def _call_tool(self, name: str, arguments: Optional[Dict[str, Any]], **kwargs) -> CallToolResult:
+        if name not in self._read_only:
+            self._writes += 1
+            self._cache.clear()
+            self._inflight = {}
+            return await self._call_with_retry(name, arguments, **kwargs)
+        
+        key = (name, json.dumps(arguments or {}, sort_keys=True, default=str))
+        cached = self._cache.get(key)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+        
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._read(key, name, arguments, **kwargs))
+            self._inflight[key] = task
+            task.add_done_callback(
+                lambda done: self._inflight.pop(key) if self._inflight.get(key) is done else None
+            )
+        
+        # Shielded so one caller giving up doesn't cancel the call for the others
+        return await asyncio.shield(task)
+    
+    async def _read(self, key: Tuple[str, str], name: str, arguments: Optional[Dict[str, Any]], **kwargs) -> CallToolResult:
+        """Call a read-only tool and cache its result"""
+        writes = self._writes
+        result = await self._call_with_retry(name, arguments, **kwargs)
+        if not result.isError and self.read_cache_ttl > 0 and writes == self._writes:
+            self._cache.pop(key, None)
+            if len(self._cache) >= self.read_cache_size:
+                del self._cache[next(iter(self._cache))]
+            self._cache[key] = (time.monotonic() + self.read_cache_ttl, result)
+        return result
+    
+    async def _call_with_retry(self, name: str, arguments: Optional[Dict[str, Any]], **kwargs) -> CallToolResult:
+        """Call a tool over the open session, retrying on rate limits"""
+        for attempt in range(self.rate_limit_retries + 1):
+            session = await self._get_session()
+            async with self._limit:
+                result = await session.call_tool(name, arguments, **kwargs)
+            if attempt == self.rate_limit_retries or not _is_rate_limited(result):
+                return result
+            
+            delay = min(2 ** attempt + random.random(), _MAX_RETRY_DELAY)
+            logger.warning(f"Tool '{name}' was rate limited, retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+    
+    async def close(self):
+        """Close the session, if one is open, from any event loop"""
+        if self._task is not None:
+            await self._on_session_loop(self._close())
+    
+    async def _close(self):
+        task, self._task = self._task, None
+        if task is not None:
+            self._closing.set()
+            await task
+
+
 class MCPClient:
     """Generic MCP Client that reads configuration from JSON registry"""
     
@@ -25,20 +264,25 @@ class MCPClient:
         self.settings = get_settings()
         self._client: Optional[MultiServerMCPClient] = None
         self._tools: Optional[Dict[str, List[BaseTool]]] = None
+        # Tools by name, per server_name argument of call_tool (None for all servers)
+        self._tools_by_name: Dict[Optional[str], Dict[str, BaseTool]] = {}
+        # Tools of all servers sorted by name, with their names, for get_tools_by_prefix
+        self._sorted_tools: Optional[Tuple[List[str], List[BaseTool]]] = None
+        self._sessions: Dict[str, PersistentSession] = {}
         self._started = False
         
         # Load configuration from registry
         if config_path is None:
             config_path = Path(__file__).parent.parent.parent / "registry" / "mcp_client_config.json"
         
+        self.config_path = Path(config_path)
         self.config = self._load_config(config_path)
         self._setup_logging()
     
     def _load_config(self, config_path: Path) -> Dict[str, Any]:
-        """Load MCP configuration from JSON file"""
+        """Load MCP configuration from JSON file, reusing it until the file changes"""
         try:
-            with open(config_path, 'r') as f:
-                return json.load(f)
+            return _read_config(str(config_path), os.path.getmtime(config_path))
         except FileNotFoundError:
             raise FileNotFoundError(f"MCP configuration file not found: {config_path}")
         except json.JSONDecodeError as e:
@@ -46,6 +290,11 @@ class MCPClient:
     
     def _setup_logging(self):
         """Setup logging based on configuration"""
+        global _logging_config
+        # Setting logger levels clears every logger's cache, so only do it for a new configuration
+        if self.config is _logging_config:
+            return
+        _logging_config = self.config
         global_config = self.config.get("global_config", {})
         
         if global_config.get("suppress_mcp_logging", False):
@@ -108,17 +357,68 @@ class MCPClient:
         
         return self._client
     
+    async def _load_tools(self, server_name: str) -> List[BaseTool]:
+        """Discover a server's tools
+        
+        With persistent_sessions enabled in the global config, the tools share
+        one long-lived session to the server. Otherwise each tool call starts
+        a new session.
+        """
+        client = self._get_client()
+        global_config = self.config.get("global_config", {})
+        if not global_config.get("persistent_sessions", False):
+            return await client.get_tools(server_name=server_name)
+        
+        session = self._sessions.get(server_name)
+        if session is None:
+            session = self._sessions[server_name] = PersistentSession(
+                client,
+                server_name,
+                max_concurrency=global_config.get("max_concurrent_tool_calls", 10),
+                rate_limit_retries=global_config.get("rate_limit_retries", 5),
+                read_cache_ttl=global_config.get("read_cache_ttl", 60),
+                read_cache_size=global_config.get("read_cache_size", 256),
+                tools_cache=self.tools_cache_path(server_name)
+            )
+        return await load_mcp_tools(session)
+    
+    def tools_cache_path(self, server_name: str) -> Optional[Path]:
+        """Cache file for a server's tool listing, or None if caching is off
+        
+        The file name is a hash of the server command, its modification time,
+        arguments and the non-secret environment variables the server is
+        configured with, so a new server binary or different toolsets get a
+        new listing.
+        """
+        cache_dir = self.config.get("global_config", {}).get("tools_cache_dir")
+        connection = self._get_client().connections.get(server_name, {})
+        command = connection.get("command")
+        if not cache_dir or not command:
+            return None
+        try:
+            mtime = os.path.getmtime(command)
+        except OSError:
+            return None
+        
+        env = connection.get("env", {})
+        settings = {
+            name: env.get(name)
+            for name in self.config["servers"][server_name].get("environment_variables", [])
+            if not _SECRET_NAME.search(name)
+        }
+        key = json.dumps([command, mtime, connection.get("args", []), settings], sort_keys=True)
+        digest = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+        return Path(cache_dir).expanduser() / f"{server_name}-{digest}.json"
+    
     async def get_tools(self, server_name: Optional[str] = None) -> List[BaseTool]:
         """Get tools from specific server or all servers"""
         if self._tools is None:
             self._tools = {}
         
-        client = self._get_client()
-        
         if server_name:
             # Get tools from specific server
             if server_name not in self._tools:
-                self._tools[server_name] = await client.get_tools(server_name=server_name)
+                self._tools[server_name] = await self._load_tools(server_name)
             return self._tools[server_name]
         else:
             # Get tools from all enabled servers
@@ -126,14 +426,22 @@ class MCPClient:
             for server_name in self.config["servers"].keys():
                 if self.config["servers"][server_name].get("enabled", True):
                     if server_name not in self._tools:
-                        self._tools[server_name] = await client.get_tools(server_name=server_name)
+                        self._tools[server_name] = await self._load_tools(server_name)
                     all_tools.extend(self._tools[server_name])
             return all_tools
     
     async def get_tools_by_prefix(self, prefix: str) -> List[BaseTool]:
-        """Get tools that start with a specific prefix"""
-        all_tools = await self.get_tools()
-        return [tool for tool in all_tools if tool.name.startswith(prefix)]
+        """Get tools that start with a specific prefix, sorted by name"""
+        if self._sorted_tools is None:
+            tools = sorted(await self.get_tools(), key=lambda tool: tool.name)
+            self._sorted_tools = ([tool.name for tool in tools], tools)
+        names, tools = self._sorted_tools
+        
+        # Names with the prefix sort between the prefix itself and the prefix
+        # with its last character incremented
+        start = bisect.bisect_left(names, prefix)
+        end = bisect.bisect_left(names, prefix[:-1] + chr(ord(prefix[-1]) + 1), start) if prefix else len(names)
+        return tools[start:end]
     
     async def get_available_tool_names(self, server_name: Optional[str] = None) -> List[str]:
         """Get list of available tool names"""
@@ -142,12 +450,15 @@ class MCPClient:
     
     async def call_tool(self, tool_name: str, arguments: dict, server_name: Optional[str] = None) -> dict:
         """Call a specific tool by name"""
-        tools = await self.get_tools(server_name)
+        tools_by_name = self._tools_by_name.get(server_name)
+        if tools_by_name is None:
+            tools = await self.get_tools(server_name)
+            # Reversed so the first tool with a name wins, as it did with a linear search
+            tools_by_name = self._tools_by_name[server_name] = {t.name: t for t in reversed(tools)}
         
-        # Find the tool by name
-        tool = next((t for t in tools if t.name == tool_name), None)
+        tool = tools_by_name.get(tool_name)
         if not tool:
-            available_tools = [t.name for t in tools]
+            available_tools = list(reversed(tools_by_name))
             raise RuntimeError(f"Tool '{tool_name}' not found. Available tools: {available_tools}")
         
         # Call the tool and return the result
@@ -171,10 +482,15 @@ class MCPClient:
     async def stop(self):
         """Stop method for compatibility"""
         self._started = False
+        for session in self._sessions.values():
+            await session.close()
+        self._sessions = {}
         if self._client:
             # Clean up client resources if needed
             self._client = None
             self._tools = None
+            self._tools_by_name = {}
+            self._sorted_tools = None
     
     async def __aenter__(self):
         """Async context manager entry"""
@@ -211,17 +527,30 @@ class MCPClientManager:
 
 
 class SimpleMCPClientManager:
-    """Simple MCP client manager without global state"""
+    """Simple MCP client manager without global state
+    
+    Deprecated: every use starts its own server session, handshake and tool
+    discovery. Use get_global_github_client or PersistentGitHubMCPClient to
+    share one client across operations.
+    """
     
     def __init__(self, config_path: Optional[str] = None):
+        warnings.warn(
+            "SimpleMCPClientManager starts a new MCP server per use, "
+            "use get_global_github_client or PersistentGitHubMCPClient instead",
+            DeprecationWarning,
+            stacklevel=2
+        )
         self.config_path = config_path
+        self.client: Optional[MCPClient] = None
     
     async def __aenter__(self) -> MCPClient:
         """Create a new client for each operation"""
-        client = MCPClient(self.config_path)
-        await client.start()
-        return client
+        self.client = MCPClient(self.config_path)
+        await self.client.start()
+        return self.client
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        # No cleanup needed as each client manages its own lifecycle
-        pass
\ No newline at end of file
+        # Close the client's server sessions, nothing else shares them
+        if self.client:
+            await self.client.stop()
\ No newline at end of file
@@ -1,6 +1,45 @@
 from src.agents.github_agent import create_github_agent
+from src.tools.github_tools import cleanup_github_tools
+import asyncio
+import threading
 import uuid
 
+
+async def ainput(prompt: str) -> str:
+    """Read a line from stdin without blocking the event loop.
+    
+    Reads on a daemon thread so a pending read never keeps the process alive
+    after the loop is interrupted.
+    
+    Args:
+        prompt: Prompt to display
+        
+    Returns:
+        The line read, without the trailing newline
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    
+    def set_result(result=None, error=None):
+        if future.done():
+            return  # Cancelled while waiting for input
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+    
+    def read_line():
+        try:
+            result = input(prompt)
+        except BaseException as e:
+            loop.call_soon_threadsafe(set_result, None, e)
+        else:
+            loop.call_soon_threadsafe(set_result, result)
+    
+    threading.Thread(target=read_line, daemon=True).start()
+    return await future
+
+
 async def interactive_mode(user_id: str, session_id: str, trace_id: str, llm_model_name: str):
     """Interactive mode for asking GitHub questions.
     
@@ -26,28 +65,37 @@ async def interactive_mode(user_id: str, session_id: str, trace_id: str, llm_mod
     print("\nReplace [owner/repo] with actual repository names")
     print("Type 'quit' to exit\n")
     
+    # Tools and the LLM connection warm up while the user types the first question
     agent = await create_github_agent(user_id, session_id, trace_id, llm_model_name)
     
-    while True:
-        try:
-            question = input("🔍 Your question: ").strip()
-            
-            if question.lower() in ['quit', 'exit', 'q']:
-                break
+    try:
+        while True:
+            try:
+                question = (await ainput("🔍 Your question: ")).strip()
                 
-            if not question:
-                continue
+                if question.lower() in ['quit', 'exit', 'q']:
+                    break
+                    
+                if not question:
+                    continue
+                    
+                # Generate unique message ID for this interaction
+                message_id = str(uuid.uuid4())
+                print(f"\n🤔 Thinking... (Message ID: {message_id[:8]}...)")
+                print("\n🤖 Answer: ", end="", flush=True)
+                async for token in agent.astream(question, message_id):
+                    print(token, end="", flush=True)
+                print("\n")
+                print("-" * 60)
                 
-            # Generate unique message ID for this interaction
-            message_id = str(uuid.uuid4())
-            print(f"\n🤔 Thinking... (Message ID: {message_id[:8]}...)")
-            response = await agent.ainvoke(question, message_id)
-            print(f"\n🤖 Answer: {response}\n")
-            print("-" * 60)
-            
-        except KeyboardInterrupt:
-            break
-        except Exception as e:
-            print(f"❌ Error: {str(e)}\n")
+            except EOFError:
+                break
+            except Exception as e:
+                print(f"❌ Error: {str(e)}\n")
+    finally:
+        # Stop the GitHub MCP server the tools kept running between questions. Ctrl+C
+        # cancels this task rather than raising KeyboardInterrupt here, so this has to
+        # run on the way out of a cancellation too.
+        await cleanup_github_tools()
     
     print("Goodbye! 👋")
\ No newline at end of file
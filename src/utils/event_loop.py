@@ -0,0 +1,74 @@
+"""
+Event loop creation, using uvloop when it is installed
+"""
+import asyncio
+import threading
+from typing import Any, Coroutine, Optional, TypeVar
+
+try:
+    import uvloop
+except ImportError:  # Optional, falls back to the default asyncio event loop
+    uvloop = None
+
+T = TypeVar("T")
+
+# Event loop shared by all synchronous entry points, so HTTP clients, MCP
+# sessions and connection pools bound to it survive between calls
+_background_loop: Optional[asyncio.AbstractEventLoop] = None
+_background_thread: Optional[threading.Thread] = None
+_background_loop_lock = threading.Lock()
+
+
+def new_event_loop() -> asyncio.AbstractEventLoop:
+    """Create a new event loop, preferring uvloop for lower scheduling overhead.
+    
+    Pass as ``loop_factory`` to ``asyncio.run`` or ``asyncio.Runner``.
+    
+    Returns:
+        New uvloop event loop if available, otherwise a default asyncio loop
+    """
+    if uvloop is not None:
+        return uvloop.new_event_loop()
+    return asyncio.new_event_loop()
+
+
+def get_background_loop() -> asyncio.AbstractEventLoop:
+    """Get the shared background event loop, starting its thread on first use.
+    
+    Returns:
+        Event loop running forever on a daemon thread
+    """
+    global _background_loop, _background_thread
+    with _background_loop_lock:
+        if _background_loop is None:
+            _background_loop = new_event_loop()
+            _background_thread = threading.Thread(
+                target=_background_loop.run_forever,
+                name="github-agent-loop",
+                daemon=True
+            )
+            _background_thread.start()
+        return _background_loop
+
+
+def run_in_background_loop(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine on the shared background loop and wait for its result.
+    
+    Lets synchronous code call async APIs without creating and tearing down
+    an event loop per call.
+    
+    Args:
+        coro: Coroutine to run
+        
+    Returns:
+        The coroutine's result
+        
+    Raises:
+        RuntimeError: If called from the background loop's own thread, where
+            waiting for the result would deadlock
+    """
+    loop = get_background_loop()
+    if threading.current_thread() is _background_thread:
+        coro.close()
+        raise RuntimeError("Cannot wait for the background event loop from its own thread")
+    return asyncio.run_coroutine_threadsafe(coro, loop).result()
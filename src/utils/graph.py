@@ -1,58 +1,86 @@
 """Graph creation utilities for the GitHub Agent workflow."""
 
-from typing import Dict, Any
+import functools
+import weakref
+from typing import Dict, Any, Optional
 from langchain_core.messages import SystemMessage
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import BaseCheckpointSaver
 from langgraph.graph import StateGraph, END
 from langgraph.prebuilt import ToolNode
 
 from src.utils.state import AgentState
 from src.utils.prompt_loader import get_prompt_loader
 
+# Compiled graphs keyed on (id(llm), tool ids, id(checkpointer)). A graph keeps
+# its LLM, tools and checkpointer alive, so the ids can't be reused while it is
+# cached, and it drops out of the cache once nothing else references it.
+_graph_cache: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+
 
 def should_continue(state: AgentState) -> str:
     """Decide whether to continue or end the conversation."""
-    messages = state["messages"]
-    last_message = messages[-1]
+    last_message = state["messages"][-1]
     
-    # If the last message has tool calls, go to tools
-    if hasattr(last_message, 'tool_calls') and last_message.tool_calls:
-        return "tools"
-    # Otherwise, end the conversation
-    return END
+    # If the last message has tool calls, go to tools, otherwise end the conversation
+    return "tools" if getattr(last_message, "tool_calls", None) else END
 
 
-def call_model(llm, state: AgentState) -> Dict[str, Any]:
-    """Call the LLM with the current state."""
-    messages = state["messages"]
-    
-    # Add system message if not present
-    if not messages or not isinstance(messages[0], SystemMessage):
-        prompt_loader = get_prompt_loader()
-        system_message = SystemMessage(content=prompt_loader.get_system_message())
-        messages = [system_message] + messages
+@functools.lru_cache(maxsize=1)
+def get_system_message() -> SystemMessage:
+    """Get the agent system message, built once so every request shares an identical prompt prefix."""
+    return SystemMessage(content=get_prompt_loader().get_system_message())
+
+
+async def call_model(llm, state: AgentState) -> Dict[str, Any]:
+    """Call the LLM with the current state, without blocking the event loop.
     
-    response = llm.invoke(messages)
+    The state is expected to start with the system message (see
+    ``get_system_message``), so messages are passed through without copying.
+    """
+    response = await llm.ainvoke(state["messages"])
     return {"messages": [response]}
 
 
-def create_agent_graph(llm, tools) -> StateGraph:
+def create_agent_graph(llm, tools, checkpointer: Optional[BaseCheckpointSaver] = None) -> StateGraph:
     """Create the agent workflow graph.
     
+    The graph does not depend on the LLM, so it can be compiled once and
+    reused: a run may pass the LLM to use as ``config["configurable"]["llm"]``.
+    Runs should start from ``[get_system_message(), HumanMessage(...)]``.
+    
+    With a checkpointer (e.g. ``MemorySaver()``), state is kept per
+    ``config["configurable"]["thread_id"]``: later runs on the same thread
+    send only the new ``HumanMessage`` and ``add_messages`` appends it to
+    the stored conversation.
+    
+    Calls with the same LLM, tools and checkpointer objects get the same
+    compiled graph while it is still in use.
+    
     Args:
-        llm: Configured LLM instance
+        llm: Configured LLM instance, used when a run doesn't pass one
         tools: List of tools for the agent
+        checkpointer: Optional checkpointer for per-thread conversation state
         
     Returns:
         Compiled StateGraph for the agent workflow
     """
+    cache_key = (id(llm), tuple(id(tool) for tool in tools), id(checkpointer))
+    graph = _graph_cache.get(cache_key)
+    if graph is not None:
+        return graph
+    
     # Create the graph
     workflow = StateGraph(AgentState)
     
     # Create tool node
     tool_node = ToolNode(tools)
     
+    async def agent_node(state: AgentState, config: RunnableConfig) -> Dict[str, Any]:
+        return await call_model(config.get("configurable", {}).get("llm", llm), state)
+    
     # Add nodes
-    workflow.add_node("agent", lambda state: call_model(llm, state))
+    workflow.add_node("agent", agent_node)
     workflow.add_node("tools", tool_node)
     
     # Set entry point
@@ -71,4 +99,5 @@ def create_agent_graph(llm, tools) -> StateGraph:
     # Tools always go back to agent
     workflow.add_edge("tools", "agent")
     
-    return workflow.compile()
\ No newline at end of file
+    graph = _graph_cache[cache_key] = workflow.compile(checkpointer=checkpointer)
+    return graph
\ No newline at end of file
@@ -1,8 +1,9 @@
 """LLM model factory for dynamic provider switching."""
 
-from typing import List, Dict
+import functools
+from typing import List, Dict, Tuple
 from langchain_core.tools import BaseTool
-from langchain_core.language_models import BaseChatModel
+from langchain_core.runnables import Runnable
 
 from src.models.azure_llm import AzureLLMProvider
 from src.models.ollama_llm import OllamaLLMProvider
@@ -16,10 +17,18 @@ _PROVIDERS = {
     "ollama": OllamaLLMProvider()
 }
 
+# Tool-bound LLM clients keyed on (provider, model, id(tools)), each stored with
+# its tools list so a recycled id() can never match a different list
+_llm_cache: Dict[Tuple[str, str, int], Tuple[List[BaseTool], Runnable]] = {}
 
+
+@functools.lru_cache(maxsize=32)
 def _parse_model_name(llm_model_name: str) -> tuple[str, str]:
     """Parse provider:model format.
     
+    A session uses the same few model names for every message, so results
+    are cached. Invalid names are not, and raise on every call.
+    
     Args:
         llm_model_name: Format "provider:model"
         
@@ -65,6 +74,70 @@ def validate_provider_config(provider_name: str) -> bool:
         return False
 
 
+def _get_provider(provider_name: str):
+    """Get a registered provider after validating its configuration.
+    
+    Raises:
+        ValueError: If provider is not registered
+        RuntimeError: If provider configuration is invalid
+    """
+    if provider_name not in _PROVIDERS:
+        raise ValueError(
+            f"Unsupported provider: {provider_name}. "
+            f"Available: {list(_PROVIDERS.keys())}"
+        )
+    
+    # Validate provider configuration
+    if not validate_provider_config(provider_name):
+        if provider_name == "azure":
+            raise RuntimeError(
+                f"Invalid Azure configuration. Please check AZURE_OPENAI_API_KEY and AZURE_OPENAI_ENDPOINT environment variables."
+            )
+        elif provider_name == "ollama":
+            raise RuntimeError(
+                f"Invalid Ollama configuration. Please check OLLAMA_ENDPOINT environment variable."
+            )
+        else:
+            raise RuntimeError(
+                f"Invalid configuration for provider: {provider_name}."
+            )
+    
+    return _PROVIDERS[provider_name]
+
+
+def _get_tool_llm(provider_name: str, model_name: str, tools: List[BaseTool], **kwargs) -> Runnable:
+    """Get the cached tool-bound client for a provider and model, creating it on first use.
+    
+    The provider configuration is validated on every call, so a client cached
+    before the settings changed isn't returned for an invalid configuration.
+    """
+    provider = _get_provider(provider_name)
+    cache_key = (provider_name, model_name, id(tools))
+    cached = _llm_cache.get(cache_key)
+    if cached is None or cached[0] is not tools:
+        cached = (tools, provider.create_tool_llm(model_name=model_name, tools=tools, **kwargs))
+        _llm_cache[cache_key] = cached
+    return cached[1]
+
+
+def get_tool_llm(llm_model_name: str, tools: List[BaseTool]) -> Runnable:
+    """Get the shared tool-bound LLM client, without tracking callbacks.
+    
+    Args:
+        llm_model_name: Format "provider:model" (e.g., "azure:gpt-4o", "ollama:llama2")
+        tools: List of tools bound to the LLM
+        
+    Returns:
+        Cached LLM instance with bound tools
+        
+    Raises:
+        ValueError: If provider or model format is invalid
+        RuntimeError: If provider configuration is invalid
+    """
+    provider_name, model_name = _parse_model_name(llm_model_name)
+    return _get_tool_llm(provider_name, model_name, tools)
+
+
 def create_llm_with_tools(
     llm_model_name: str,
     tools: List[BaseTool],
@@ -73,7 +146,7 @@ def create_llm_with_tools(
     trace_id: str,
     message_id: str,
     **kwargs
-) -> BaseChatModel:
+) -> Runnable:
     """Create LLM instance based on provider:model format.
     
     Main entry point for creating LLM instances with tool binding.
@@ -89,7 +162,7 @@ def create_llm_with_tools(
         **kwargs: Additional arguments for provider
         
     Returns:
-        Configured LLM instance with bound tools
+        Runnable wrapping the tool-bound LLM with the Langfuse callback attached
         
     Raises:
         ValueError: If provider or model format is invalid
@@ -97,39 +170,19 @@ def create_llm_with_tools(
     """
     provider_name, model_name = _parse_model_name(llm_model_name)
     
-    if provider_name not in _PROVIDERS:
-        raise ValueError(
-            f"Unsupported provider: {provider_name}. "
-            f"Available: {list(_PROVIDERS.keys())}"
-        )
-    
-    provider = _PROVIDERS[provider_name]
-    
     # Get services
     langfuse_service, redis_service, settings = _get_services()
     
-    # Validate provider configuration
-    if not validate_provider_config(provider_name):
-        if provider_name == "azure":
-            raise RuntimeError(
-                f"Invalid Azure configuration. Please check AZURE_OPENAI_API_KEY and AZURE_OPENAI_ENDPOINT environment variables."
-            )
-        elif provider_name == "ollama":
-            raise RuntimeError(
-                f"Invalid Ollama configuration. Please check OLLAMA_ENDPOINT environment variable."
-            )
-        else:
-            raise RuntimeError(
-                f"Invalid configuration for provider: {provider_name}."
-            )
+    # Reuse the tool-bound client, only the tracking callback is per message
+    llm = _get_tool_llm(provider_name, model_name, tools, **kwargs)
     
-    # Create LLM instance
-    return provider.create_llm(
+    langfuse_handler = langfuse_service.create_callback_handler(
+        provider=provider_name,
         model_name=model_name,
-        tools=tools,
         user_id=user_id,
         session_id=session_id,
         trace_id=trace_id,
         message_id=message_id,
-        **kwargs
-    )
\ No newline at end of file
+        metadata=kwargs.get("metadata")
+    )
+    return llm.with_config(callbacks=[langfuse_handler])
@@ -2,7 +2,8 @@
 Utility for loading and validating prompts from YAML files
 """
 import os
-from typing import Dict, List, Optional
+from string import Formatter
+from typing import Callable, Dict, List, Optional
 from pydantic import BaseModel, Field
 import yaml
 
@@ -21,6 +22,7 @@ class QueryPrompts(BaseModel):
     commits: str
     file_content: str
     search_repos: str
+    overview: str
 
 
 class TestPrompts(BaseModel):
@@ -80,6 +82,26 @@ class PromptLoader:
         return prompts.test.example_queries
 
 
+def compile_template(template: str) -> Callable[..., str]:
+    """Parse a str.format template once and return a function that renders it
+    
+    The returned function takes the template fields as keyword arguments and
+    gives the same result as template.format(**fields). Templates using format
+    specs, conversions, positional or indexed fields fall back to str.format.
+    """
+    parts = list(Formatter().parse(template))
+    if any(spec or conversion or (field is not None and not field.isidentifier())
+           for _, field, spec, conversion in parts):
+        return template.format
+    
+    def render(**fields) -> str:
+        return "".join(
+            literal if field is None else literal + format(fields[field], "")
+            for literal, field, _, _ in parts
+        )
+    return render
+
+
 # Global instance
 _prompt_loader: Optional[PromptLoader] = None
 
@@ -2,6 +2,7 @@
 Session context management for sharing session parameters across the application
 """
 from typing import Optional
+import functools
 import uuid
 
 
@@ -53,16 +54,10 @@ class SessionContext:
         return self._llm_model_name or "gpt-4o"
 
 
-# Global session context instance
-_session_context: Optional[SessionContext] = None
-
-
+@functools.cache
 def get_session_context() -> SessionContext:
     """Get the global session context"""
-    global _session_context
-    if _session_context is None:
-        _session_context = SessionContext()
-    return _session_context
+    return SessionContext()
 
 
 def set_global_session_parameters(
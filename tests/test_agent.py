@@ -5,8 +5,10 @@ Agent integration tests
 import asyncio
 import uuid
 import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
 
-from src.agents.github_agent import create_github_agent
+from src.agents.github_agent import GitHubAgent, create_github_agent
 
 
 class TestGitHubAgent:
@@ -69,6 +71,173 @@ class TestGitHubAgent:
         except Exception as e:
             pytest.fail(f"Repository query failed: {e}")
 
+    
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_astream_yields_text_chunks(self):
+        """Test that astream yields only non-empty chat model chunks"""
+        agent = GitHubAgent("test_user", "session", "trace", "azure:gpt-4o")
+        
+        async def fake_events(state, version, **kwargs):
+            yield {"event": "on_chain_start", "run_id": "chain", "data": {}}
+            yield {"event": "on_chat_model_stream", "run_id": "llm", "data": {"chunk": SimpleNamespace(content="Hello")}}
+            yield {"event": "on_chat_model_stream", "run_id": "llm", "data": {"chunk": SimpleNamespace(content="")}}
+            yield {"event": "on_chat_model_stream", "run_id": "llm", "data": {"chunk": SimpleNamespace(content=" world")}}
+            yield {"event": "on_chat_model_end", "run_id": "llm", "data": {"output": SimpleNamespace(content="Hello world")}}
+        
+        agent.graph = SimpleNamespace(astream_events=fake_events)
+        with patch.object(agent, "_prepare", AsyncMock(return_value=({"messages": []}, {}))):
+            tokens = [token async for token in agent.astream("Hi", "message")]
+        
+        assert tokens == ["Hello", " world"]
+
+    
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_abatch_bounds_concurrency(self):
+        """Test that abatch keeps message order and limits concurrent calls"""
+        agent = GitHubAgent("test_user", "session", "trace", "azure:gpt-4o")
+        running = 0
+        peak = 0
+        
+        async def fake_ainvoke(message, message_id, **kwargs):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return f"{message_id}:{message}"
+        
+        with patch.object(agent, "ainvoke", fake_ainvoke):
+            responses = await agent.abatch(["a", "b", "c", "d"], ["1", "2", "3", "4"], concurrency=2)
+        
+        assert responses == ["1:a", "2:b", "3:c", "4:d"]
+        assert peak == 2
+
+    
+    @pytest.mark.unit
+    def test_invoke_reuses_background_loop(self):
+        """Test that synchronous invoke calls share one event loop"""
+        agent = GitHubAgent("test_user", "session", "trace", "azure:gpt-4o")
+        
+        async def fake_ainvoke(message, message_id, **kwargs):
+            return asyncio.get_running_loop()
+        
+        with patch.object(agent, "ainvoke", fake_ainvoke):
+            first = agent.invoke("a", "1")
+            second = agent.invoke("b", "2")
+        
+        assert first is second
+        assert first.is_running()
+
+    
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_create_github_agent_warms_up(self):
+        """Test that the factory loads tools in the background, pinging the LLM only when enabled"""
+        tools = [MagicMock()]
+        llm = MagicMock(ainvoke=AsyncMock())
+        
+        with patch("src.agents.github_agent.get_github_tools", AsyncMock(return_value=tools)), \
+             patch("src.agents.github_agent.get_tool_llm", return_value=llm) as mock_get_llm, \
+             patch("src.agents.github_agent.create_agent_graph") as mock_graph:
+            agent = await create_github_agent("test_user", "session", "trace", "azure:gpt-4o")
+            await agent._warmup_task
+            assert agent._ping_task is None
+            
+            with patch("src.agents.github_agent.AGENT_WARMUP_PING", True):
+                agent = await create_github_agent("test_user", "session", "trace", "azure:gpt-4o")
+                await agent._warmup_task
+                await agent._ping_task
+        
+        assert agent.tools is tools
+        assert agent.graph is mock_graph.return_value
+        mock_get_llm.assert_called_with("azure:gpt-4o", tools)
+        llm.ainvoke.assert_awaited_once()
+    
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_first_message_does_not_wait_for_warmup_ping(self):
+        """Test that a slow warmup ping doesn't delay the first message"""
+        from langchain_core.messages import AIMessage
+        from langchain_core.runnables import RunnableLambda
+        
+        ping_started = asyncio.Event()
+        
+        async def slow_ping(messages):
+            ping_started.set()
+            await asyncio.sleep(3600)
+        
+        ping_llm = MagicMock(ainvoke=slow_ping)
+        answer_llm = RunnableLambda(lambda messages: AIMessage(content="main"))
+        
+        with patch("src.agents.github_agent.AGENT_WARMUP_PING", True), \
+             patch("src.agents.github_agent.get_github_tools", AsyncMock(return_value=[])), \
+             patch("src.agents.github_agent.get_tool_llm", return_value=ping_llm), \
+             patch("src.agents.github_agent.create_llm_with_tools", return_value=answer_llm):
+            agent = await create_github_agent("test_user", "session", "trace", "azure:gpt-4o")
+            await ping_started.wait()
+            
+            assert await asyncio.wait_for(agent.ainvoke("Hi", "message"), timeout=5) == "main"
+            agent._ping_task.cancel()
+
+    
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_conversation_memory_sends_only_new_message(self):
+        """Test that later turns on a session append to the stored conversation"""
+        from langchain_core.messages import AIMessage, SystemMessage
+        from langchain_core.runnables import RunnableLambda
+        
+        seen = []
+        
+        def fake_llm(messages):
+            seen.append(list(messages))
+            return AIMessage(content=f"answer {len(seen)}")
+        
+        agent = GitHubAgent("test_user", "session", "trace", "azure:gpt-4o")
+        with patch("src.agents.github_agent.AGENT_CONVERSATION_MEMORY", True), \
+             patch("src.agents.github_agent.get_github_tools", AsyncMock(return_value=[])), \
+             patch("src.agents.github_agent.create_llm_with_tools", return_value=RunnableLambda(fake_llm)):
+            assert await agent.ainvoke("first", "1") == "answer 1"
+            assert await agent.ainvoke("second", "2") == "answer 2"
+        
+        assert [type(m).__name__ for m in seen[1]] == ["SystemMessage", "HumanMessage", "AIMessage", "HumanMessage"]
+        assert sum(isinstance(m, SystemMessage) for m in seen[1]) == 1
+    
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_astream_yields_cached_reply(self):
+        """Test that a reply served from the response cache is still streamed"""
+        from langchain_core.caches import InMemoryCache
+        from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+        from langchain_core.messages import AIMessage
+        
+        cache = InMemoryCache()
+        agent = GitHubAgent("test_user", "session", "trace", "azure:gpt-4o")
+        for _ in range(2):
+            llm = GenericFakeChatModel(messages=iter([AIMessage(content="hello world")]), cache=cache)
+            with patch("src.agents.github_agent.get_github_tools", AsyncMock(return_value=[])), \
+                 patch("src.agents.github_agent.create_llm_with_tools", return_value=llm):
+                chunks = [chunk async for chunk in agent.astream("Hi", "message")]
+            assert "".join(chunks) == "hello world"
+    
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_abatch_deletes_finished_threads(self):
+        """Test that batched one-shot messages don't leave conversation state behind"""
+        from langchain_core.messages import AIMessage
+        from langchain_core.runnables import RunnableLambda
+        
+        agent = GitHubAgent("test_user", "session", "trace", "azure:gpt-4o", conversation_memory=True)
+        with patch("src.agents.github_agent.get_github_tools", AsyncMock(return_value=[])), \
+             patch("src.agents.github_agent.create_llm_with_tools",
+                   return_value=RunnableLambda(lambda messages: AIMessage(content="answer"))):
+            assert await agent.abatch(["first", "second"], ["1", "2"]) == ["answer", "answer"]
+        
+        assert not agent._started_threads
+        assert not list(agent.graph.checkpointer.list(None))
+
 
 if __name__ == "__main__":
     # Run tests directly  
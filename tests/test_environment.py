@@ -7,8 +7,9 @@ import sys
 import subprocess
 from pathlib import Path
 import pytest
+from unittest.mock import patch
 
-from src.config.settings import get_settings
+from src.config.settings import _environment_status, get_settings
 
 
 class TestEnvironmentSetup:
@@ -59,6 +60,37 @@ class TestEnvironmentSetup:
         
         if not settings.LANGFUSE_PUBLIC_KEY or settings.LANGFUSE_PUBLIC_KEY.startswith("your_"):
             print("⚠️  Warning: LANGFUSE_PUBLIC_KEY not configured (observability disabled)")
+    
+    @pytest.mark.unit
+    def test_settings_singleton_reload(self):
+        """Test that get_settings returns one instance until its cache is cleared"""
+        settings = get_settings()
+        assert get_settings() is settings
+        
+        with patch.dict(os.environ, {"MODEL_NAME": "test-model"}):
+            get_settings.cache_clear()
+            try:
+                assert get_settings() is not settings
+                assert get_settings().MODEL_NAME == "test-model"
+            finally:
+                get_settings.cache_clear()
+    
+    @pytest.mark.unit
+    def test_environment_status_follows_settings_reload(self):
+        """Test that the environment check sees settings reloaded from the environment"""
+        get_settings.cache_clear()
+        try:
+            with patch.dict(os.environ, {"GITHUB_PERSONAL_ACCESS_TOKEN": ""}):
+                get_settings.cache_clear()
+                missing, _ = _environment_status(get_settings())
+                assert "GITHUB_PERSONAL_ACCESS_TOKEN" in missing
+                
+                os.environ["GITHUB_PERSONAL_ACCESS_TOKEN"] = "ghp_test"
+                get_settings.cache_clear()
+                missing, _ = _environment_status(get_settings())
+                assert "GITHUB_PERSONAL_ACCESS_TOKEN" not in missing
+        finally:
+            get_settings.cache_clear()
 
 
 if __name__ == "__main__":
@@ -3,9 +3,25 @@
 GitHub Tools tests
 """
 import asyncio
+import contextlib
+import json
 import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from langchain_core.tools import StructuredTool
+from langchain_mcp_adapters.tools import load_mcp_tools
+from mcp.types import CallToolResult, ListToolsResult, TextContent, Tool
 
-from src.tools.github_tools import get_github_tools
+from src.tools.github_tools import (
+    _add_sync_entry,
+    call_github_tools,
+    get_github_tool,
+    get_github_tools,
+    get_github_tools_by_prefix,
+    invalidate_tools_cache,
+    list_all_pages,
+    warm_start
+)
+from src.tools.mcp_client.mcp_client import PersistentSession
 
 
 class TestGitHubTools:
@@ -67,6 +83,195 @@ class TestGitHubTools:
         except Exception as e:
             pytest.fail(f"search_repositories tool failed: {e}")
 
+    
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_tools_discovered_once(self):
+        """Test that concurrent and later callers share one MCP discovery"""
+        discover = AsyncMock(return_value=["tool"])
+        with patch("src.tools.github_tools._tools_task", None), \
+             patch("src.tools.github_tools._discover_github_tools", discover):
+            first, second = await asyncio.gather(get_github_tools(), get_github_tools())
+            third = await get_github_tools()
+        
+        discover.assert_awaited_once()
+        assert first is second is third
+    
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_invalidate_tools_cache(self):
+        """Test that invalidating the tool cache forces a new discovery"""
+        discover = AsyncMock(return_value=["tool"])
+        with patch("src.tools.github_tools._tools_task", None), \
+             patch("src.tools.github_tools._discover_github_tools", discover):
+            await get_github_tools()
+            invalidate_tools_cache()
+            await get_github_tools()
+        
+        assert discover.await_count == 2
+    
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_warm_start_prefetches_tools_when_enabled(self):
+        """Test that warm start begins discovery only when enabled, and callers reuse it"""
+        discover = AsyncMock(return_value=["tool"])
+        with patch("src.tools.github_tools._tools_task", None), \
+             patch("src.tools.github_tools._discover_github_tools", discover):
+            with patch("src.tools.github_tools.AGENT_WARM_START", False):
+                warm_start()
+            await asyncio.sleep(0)
+            discover.assert_not_awaited()
+            
+            with patch("src.tools.github_tools.AGENT_WARM_START", True):
+                warm_start()
+            await asyncio.sleep(0)
+            discover.assert_awaited_once()
+            
+            assert await get_github_tools() == ["tool"]
+        discover.assert_awaited_once()
+
+    
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_get_github_tool_by_name(self):
+        """Test that tools are looked up by name and the index follows rediscovery"""
+        first, second = MagicMock(), MagicMock()
+        first.name, second.name = "get_me", "list_branches"
+        
+        with patch("src.tools.github_tools.get_github_tools", new=AsyncMock(return_value=[first, second])):
+            assert await get_github_tool("list_branches") is second
+            assert await get_github_tool("missing_tool") is None
+        
+        with patch("src.tools.github_tools.get_github_tools", new=AsyncMock(return_value=[first])):
+            assert await get_github_tool("list_branches") is None
+    
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_get_github_tools_by_prefix(self):
+        """Test that prefix lookups return exactly the matching tools, sorted by name"""
+        tools = []
+        for name in ["list_tags", "get_me", "list_branches", "listing", "list", "search_code"]:
+            tool = MagicMock()
+            tool.name = name
+            tools.append(tool)
+        
+        with patch("src.tools.github_tools.get_github_tools", new=AsyncMock(return_value=tools)):
+            assert [tool.name for tool in await get_github_tools_by_prefix("list_")] == ["list_branches", "list_tags"]
+            assert [tool.name for tool in await get_github_tools_by_prefix("list")] == [
+                "list", "list_branches", "list_tags", "listing"
+            ]
+            assert await get_github_tools_by_prefix("create_") == []
+            assert len(await get_github_tools_by_prefix("")) == len(tools)
+    
+    @pytest.mark.unit
+    def test_sync_invoke_runs_on_background_loop(self):
+        """Test that async-only tools can be invoked synchronously on the shared loop"""
+        loops = []
+        
+        async def get_me() -> str:
+            loops.append(asyncio.get_running_loop())
+            return "octocat"
+        
+        tool = StructuredTool.from_function(coroutine=get_me, name="get_me", description="Get the user")
+        _add_sync_entry(tool)
+        
+        assert tool.invoke({}) == "octocat"
+        assert tool.invoke({}) == "octocat"
+        assert loops[0] is loops[1]
+    
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_sync_and_async_invoke_share_session(self):
+        """Test that sync and async calls of an MCP tool go over the same session"""
+        session = AsyncMock()
+        session.list_tools.return_value = ListToolsResult(tools=[Tool(name="get_me", inputSchema={"type": "object"})])
+        session.call_tool.return_value = CallToolResult(content=[TextContent(type="text", text="octocat")])
+        opened = []
+        
+        @contextlib.asynccontextmanager
+        async def open_session(server_name):
+            opened.append(server_name)
+            yield session
+        
+        persistent = PersistentSession(MagicMock(session=open_session), "github")
+        tool, = await load_mcp_tools(persistent)
+        _add_sync_entry(tool)
+        
+        assert await tool.ainvoke({}) == "octocat"
+        assert await asyncio.to_thread(tool.invoke, {}) == "octocat"
+        assert opened == ["github"]
+        await persistent.close()
+    
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_call_github_tools_runs_concurrently(self):
+        """Test that batched tool calls overlap and keep input order"""
+        running = peak = 0
+        
+        async def list_branches(arguments):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return f"branches of {arguments['repo']}"
+        
+        tool = MagicMock()
+        tool.name = "list_branches"
+        tool.ainvoke = list_branches
+        
+        with patch("src.tools.github_tools.get_github_tools", AsyncMock(return_value=[tool])):
+            results = await call_github_tools([
+                ("list_branches", {"owner": "o", "repo": "a"}),
+                ("missing_tool", {}),
+                ("list_branches", {"owner": "o", "repo": "b"}),
+            ])
+        
+        assert results[0] == "branches of a"
+        assert isinstance(results[1], ValueError)
+        assert results[2] == "branches of b"
+        assert peak == 2
+    
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_list_all_pages_prefetches_until_short_page(self):
+        """Test that pages after the first are fetched concurrently until one comes back short"""
+        requested = []
+        
+        async def list_commits(arguments):
+            page = arguments["page"]
+            requested.append(page)
+            count = 2 if page < 4 else 1 if page == 4 else 0
+            return json.dumps([f"{page}-{i}" for i in range(count)])
+        
+        tool = MagicMock()
+        tool.name = "list_commits"
+        tool.ainvoke = list_commits
+        
+        with patch("src.tools.github_tools.get_github_tools", AsyncMock(return_value=[tool])):
+            items = await list_all_pages("list_commits", {"owner": "o", "repo": "r"}, per_page=2, prefetch=2)
+        
+        assert items == ["1-0", "1-1", "2-0", "2-1", "3-0", "3-1", "4-0"]
+        assert requested == [1, 2, 3, 4, 5]
+    
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_list_all_pages_normalises_content(self):
+        """Test that split text content is joined and unreadable pages raise ValueError"""
+        tool = MagicMock()
+        tool.name = "list_commits"
+        
+        with patch("src.tools.github_tools.get_github_tools", AsyncMock(return_value=[tool])):
+            tool.ainvoke = AsyncMock(return_value=['["a", ', '"b"]'])
+            assert await list_all_pages("list_commits", {}) == ["a", "b"]
+            
+            tool.ainvoke = AsyncMock(return_value="not json")
+            with pytest.raises(ValueError, match="list_commits.*page 1"):
+                await list_all_pages("list_commits", {})
+            
+            tool.ainvoke = AsyncMock(return_value={"items": []})
+            with pytest.raises(ValueError, match="page 1"):
+                await list_all_pages("list_commits", {})
 
 if __name__ == "__main__":
     # Run tests directly
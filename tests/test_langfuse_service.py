@@ -1,6 +1,7 @@
 """Tests for the Langfuse service implementation."""
 
 import pytest
+from dataclasses import replace
 from unittest.mock import MagicMock, patch
 from langfuse.callback import CallbackHandler
 
@@ -60,6 +61,33 @@ class TestCallbackFactory:
         assert isinstance(handler, CallbackHandler)
         assert handler.metadata.get("custom") == "value"
         assert handler.metadata.get("provider") == TEST_CONFIG.provider
+    
+    @pytest.mark.unit
+    def test_handlers_share_client(self, mock_settings):
+        """Test that handlers reuse one Langfuse client instead of creating their own."""
+        factory = CallbackFactory(mock_settings)
+        
+        with patch("src.services.langfuse_service.Langfuse") as mock_langfuse:
+            first = factory.create_handler(TEST_CONFIG)
+            second = factory.create_handler(TEST_CONFIG)
+        
+        mock_langfuse.assert_called_once()
+        assert mock_langfuse.return_value.trace.call_count == 2
+        assert first is not second
+
+    @pytest.mark.unit
+    def test_custom_metadata_does_not_leak_between_handlers(self, mock_settings):
+        """Test that per-handler metadata stays out of the shared per-model fields."""
+        factory = CallbackFactory(mock_settings)
+        
+        with patch("src.services.langfuse_service.Langfuse"):
+            first = factory.create_handler(replace(TEST_CONFIG, metadata={"custom": "value"}))
+            second = factory.create_handler(replace(TEST_CONFIG, metadata=None, message_id="other"))
+        
+        assert first.metadata["custom"] == "value"
+        assert "custom" not in second.metadata
+        assert second.metadata["message_id"] == "other"
+        assert second.metadata["llm_model_name"] == "test-provider:test-model"
 
 class TestLangfuseService:
     """Tests for the LangfuseService class."""
@@ -127,6 +155,19 @@ class TestLangfuseService:
             assert status["has_secret_key"] is True
             assert status["has_public_key"] is True
 
+    @pytest.mark.unit
+    def test_get_health_status_reused_until_settings_change(self, langfuse_service):
+        """Test that health status is built once per Langfuse configuration."""
+        with patch.object(langfuse_service.settings, 'LANGFUSE_SECRET_KEY', 'test-key'), \
+             patch.object(langfuse_service.settings, 'LANGFUSE_PUBLIC_KEY', 'test-key'):
+            first = langfuse_service.get_health_status()
+            assert langfuse_service.get_health_status() is first
+            
+            with patch.object(langfuse_service.settings, 'LANGFUSE_PUBLIC_KEY', None):
+                status = langfuse_service.get_health_status()
+                assert status is not first
+                assert status["configured"] is False
+
 def test_get_langfuse_service_singleton():
     """Test the global service singleton pattern."""
     service1 = get_langfuse_service()
@@ -4,6 +4,8 @@ import pytest
 from unittest.mock import MagicMock, patch, Mock
 from langchain_core.tools import BaseTool
 
+from src.config.parameters import AGENT_MAX_RETRIES
+
 # Test constants
 TEST_USER_ID = "test-user"
 TEST_SESSION_ID = "test-session"
@@ -94,6 +96,7 @@ class TestAzureLLMProvider:
                     
                     # Verify Azure LLM was configured correctly
                     mock_azure_class.assert_called_once()
+                    assert mock_azure_class.call_args.kwargs["max_retries"] == AGENT_MAX_RETRIES
                     assert llm == mock_llm
                     mock_llm.bind_tools.assert_called_once_with(tools=[mock_tool])
 
@@ -3,9 +3,17 @@
 GitHub MCP Client tests
 """
 import asyncio
+import contextlib
+import os
 import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
 
-from src.tools.mcp_client.github_client import GitHubMCPClient
+from src.tools.mcp_client.github_client import GitHubMCPClient, cleanup_global_client, get_global_github_client
+from mcp.types import CallToolResult, ListToolsResult, TextContent, Tool, ToolAnnotations
+
+from src.tools.mcp_client.daemon import MCPClientDaemon
+from src.tools.mcp_client.mcp_client import MCPClient, PersistentSession, SimpleMCPClientManager
+from src.utils.event_loop import run_in_background_loop
 
 
 class TestMCPClient:
@@ -56,6 +64,240 @@ class TestMCPClient:
             await client.stop()
         except Exception as e:
             pytest.fail(f"Failed to call basic tool: {e}")
+    
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_persistent_session_reused_across_calls(self):
+        """Test that tool calls share one server session until it is closed"""
+        session = AsyncMock()
+        opened = []
+        
+        @contextlib.asynccontextmanager
+        async def open_session(server_name):
+            opened.append(server_name)
+            yield session
+        
+        client = MagicMock()
+        client.session = open_session
+        persistent = PersistentSession(client, "github")
+        
+        await asyncio.gather(*(persistent.call_tool("get_me", {}) for _ in range(3)))
+        await persistent.list_tools()
+        assert opened == ["github"]
+        assert session.call_tool.await_count == 3
+        
+        await persistent.close()
+        await persistent.call_tool("get_me", {})
+        assert opened == ["github", "github"]
+        await persistent.close()
+    
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_persistent_session_shared_across_event_loops(self):
+        """Test that callers on different event loops share one session, closed from any loop"""
+        session = AsyncMock()
+        opened, closed = [], []
+        
+        @contextlib.asynccontextmanager
+        async def open_session(server_name):
+            opened.append(server_name)
+            try:
+                yield session
+            finally:
+                closed.append(server_name)
+        
+        persistent = PersistentSession(MagicMock(session=open_session), "github")
+        for _ in range(2):
+            await persistent.call_tool("get_me", {})
+            run_in_background_loop(persistent.call_tool("get_me", {}))
+            await asyncio.to_thread(asyncio.run, persistent.call_tool("get_me", {}))
+        assert session.call_tool.await_count == 6
+        assert opened == ["github"]
+        
+        await asyncio.to_thread(asyncio.run, persistent.close())
+        assert closed == ["github"]
+    
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_persistent_session_limits_and_retries(self):
+        """Test that tool calls are capped in concurrency and retried on rate limits"""
+        running = peak = 0
+        limited = CallToolResult(
+            content=[TextContent(type="text", text="403 You have exceeded a secondary rate limit")], isError=True
+        )
+        ok = CallToolResult(content=[TextContent(type="text", text="ok")])
+        results = [limited, limited] + [ok] * 4
+        
+        async def call_tool(name, arguments, **kwargs):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return results.pop(0)
+        
+        @contextlib.asynccontextmanager
+        async def open_session(server_name):
+            yield MagicMock(call_tool=call_tool)
+        
+        persistent = PersistentSession(MagicMock(session=open_session), "github", max_concurrency=2)
+        
+        with patch("src.tools.mcp_client.mcp_client.asyncio.sleep", AsyncMock()) as sleep:
+            first = await persistent.call_tool("get_me", {})
+        backoffs = [call.args[0] for call in sleep.await_args_list if call.args[0] >= 1]
+        assert len(backoffs) == 2 and backoffs[0] < backoffs[1]
+        assert first is ok
+        
+        await asyncio.gather(*(persistent.call_tool("get_me", {}) for _ in range(3)))
+        assert peak == 2
+        await persistent.close()
+    
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_persistent_session_caches_read_only_results(self):
+        """Test that read-only tool results are reused until a write tool is called"""
+        session = AsyncMock()
+        session.list_tools.return_value = ListToolsResult(tools=[
+            Tool(name="list_branches", inputSchema={}, annotations=ToolAnnotations(readOnlyHint=True)),
+            Tool(name="create_branch", inputSchema={}, annotations=ToolAnnotations(readOnlyHint=False)),
+        ])
+        session.call_tool.return_value = CallToolResult(content=[TextContent(type="text", text="main")])
+        
+        @contextlib.asynccontextmanager
+        async def open_session(server_name):
+            yield session
+        
+        persistent = PersistentSession(MagicMock(session=open_session), "github")
+        await persistent.list_tools()
+        
+        await persistent.call_tool("list_branches", {"owner": "o", "repo": "r"})
+        await persistent.call_tool("list_branches", {"repo": "r", "owner": "o"})
+        assert session.call_tool.await_count == 1
+        
+        await persistent.call_tool("create_branch", {"owner": "o", "repo": "r", "branch": "b"})
+        await persistent.call_tool("list_branches", {"owner": "o", "repo": "r"})
+        assert session.call_tool.await_count == 3
+        await persistent.close()
+    
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_persistent_session_coalesces_identical_reads(self):
+        """Test that concurrent identical read-only calls share one request"""
+        calls = 0
+        
+        async def call_tool(name, arguments, **kwargs):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return CallToolResult(content=[TextContent(type="text", text="pr")])
+        
+        @contextlib.asynccontextmanager
+        async def open_session(server_name):
+            yield MagicMock(call_tool=call_tool)
+        
+        persistent = PersistentSession(MagicMock(session=open_session), "github", read_cache_ttl=0)
+        persistent._read_only.add("get_pull_request")
+        
+        results = await asyncio.gather(*(
+            persistent.call_tool("get_pull_request", {"owner": "o", "repo": "r", "pullNumber": 42})
+            for _ in range(3)
+        ))
+        
+        assert calls == 1
+        assert results[0] is results[1] is results[2]
+        assert not persistent._inflight
+        await persistent.close()
+    
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_persistent_session_tools_cache(self, tmp_path):
+        """Test that a cached tool listing is used without opening a session"""
+        session = AsyncMock()
+        session.list_tools.return_value = ListToolsResult(tools=[
+            Tool(name="list_branches", inputSchema={"type": "object"}, annotations=ToolAnnotations(readOnlyHint=True)),
+        ])
+        opened = []
+        
+        @contextlib.asynccontextmanager
+        async def open_session(server_name):
+            opened.append(server_name)
+            yield session
+        
+        tools_cache = tmp_path / "tools" / "github.json"
+        first = PersistentSession(MagicMock(session=open_session), "github", tools_cache=tools_cache)
+        await first.list_tools()
+        await first.close()
+        assert tools_cache.exists()
+        
+        second = PersistentSession(MagicMock(session=open_session), "github", tools_cache=tools_cache)
+        result = await second.list_tools()
+        assert [tool.name for tool in result.tools] == ["list_branches"]
+        assert second._read_only == {"list_branches"}
+        assert opened == ["github"]
+        await second.close()
+    
+    @pytest.mark.unit
+    def test_tools_cache_path_keyed_on_server_settings(self, tmp_path):
+        """Test that only the server's non-secret configured variables change the tools cache file"""
+        command = tmp_path / "github-mcp-server"
+        command.write_text("")
+        client = MCPClient()
+        
+        def cache_path(**env):
+            client._client = MagicMock(connections={"github": {"command": str(command), "args": [], "env": env}})
+            return client.tools_cache_path("github")
+        
+        base = cache_path(GITHUB_HOST="github.com", GITHUB_PERSONAL_ACCESS_TOKEN="one")
+        assert cache_path(GITHUB_HOST="github.com", GITHUB_PERSONAL_ACCESS_TOKEN="two") == base
+        assert cache_path(GITHUB_HOST="github.com", GITHUB_PERSONAL_ACCESS_TOKEN="one", GITHUB_RUN_ID="7") == base
+        assert cache_path(GITHUB_HOST="ghe.example.com", GITHUB_PERSONAL_ACCESS_TOKEN="one") != base
+    
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_daemon_leaves_live_socket_alone(self, tmp_path):
+        """Test that the daemon refuses to replace a socket another process is listening on"""
+        socket_path = str(tmp_path / "daemon.sock")
+        server = await asyncio.start_unix_server(lambda reader, writer: writer.close(), path=socket_path)
+        async with server:
+            with pytest.raises(RuntimeError):
+                await MCPClientDaemon(socket_path).serve_forever()
+            assert os.path.exists(socket_path)
+    
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_global_client_shared(self):
+        """Test that the global GitHub client is shared until cleaned up"""
+        with patch("src.tools.mcp_client.github_client._global_client", None):
+            first = await get_global_github_client()
+            assert await get_global_github_client() is first
+            
+            await cleanup_global_client()
+            assert await get_global_github_client() is not first
+            await cleanup_global_client()
+    
+    @pytest.mark.unit
+    def test_config_reused_until_file_changes(self, tmp_path):
+        """Test that clients share the parsed configuration until the file is modified"""
+        config_path = tmp_path / "mcp_client_config.json"
+        config_path.write_text('{"servers": {}, "global_config": {"log_level": "ERROR"}}')
+        
+        first, second = MCPClient(config_path), MCPClient(config_path)
+        assert first.config is second.config
+        
+        config_path.write_text('{"servers": {}, "global_config": {"log_level": "WARNING"}}')
+        os.utime(config_path, (1, 1))
+        assert MCPClient(config_path).config["global_config"]["log_level"] == "WARNING"
+    
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_simple_client_manager_deprecated_and_stops_client(self):
+        """Test that SimpleMCPClientManager warns and closes the client it created"""
+        with pytest.warns(DeprecationWarning):
+            manager = SimpleMCPClientManager()
+        
+        async with manager as client:
+            assert client.process is not None
+        assert client.process is None
 
 
 if __name__ == "__main__":
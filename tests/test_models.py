@@ -9,8 +9,9 @@ from typing import List, Any
 
 from langchain_core.callbacks.base import BaseCallbackHandler
 from langchain_core.callbacks.manager import BaseCallbackManager
+from langchain_core.utils.function_calling import convert_to_openai_tool
 
-from src.models.base_provider import BaseLLMProvider
+from src.models.base_provider import BaseLLMProvider, DigestKeyedCache, get_response_cache, get_tool_schemas
 from src.models.azure_llm import AzureLLMProvider
 from src.models.ollama_llm import OllamaLLMProvider
 from src.services.langfuse_service import LangfuseService
@@ -54,6 +55,61 @@ class TestBaseLLMProvider:
         
         # Verify it's an abstract base class
         assert issubclass(BaseLLMProvider, ABC), "BaseLLMProvider should inherit from ABC"
+    
+    @pytest.mark.unit
+    def test_response_cache_is_shared(self):
+        """Test that all providers share one response cache"""
+        with patch("src.models.base_provider.AGENT_RESPONSE_CACHE", True), \
+             patch("src.models.base_provider._response_cache", None):
+            cache = get_response_cache()
+            assert cache is not None
+            assert get_response_cache() is cache
+        
+        with patch("src.models.base_provider.AGENT_RESPONSE_CACHE", False), \
+             patch("src.models.base_provider._response_cache", None):
+            assert get_response_cache() is None
+    
+    @pytest.mark.unit
+    def test_response_cache_skipped_for_sampling_models(self):
+        """Test that a model with temperature above 0 gets no response cache"""
+        with patch("src.models.base_provider.AGENT_RESPONSE_CACHE", True), \
+             patch("src.models.base_provider._response_cache", None), \
+             patch("src.models.ollama_llm.AGENT_TEMPERATURE", 0.1):
+            assert get_response_cache(0.1) is None
+            assert get_response_cache(0) is not None
+            
+            provider = OllamaLLMProvider(langfuse_service=MagicMock())
+            llm = provider._build_llm("llama3")
+            assert llm.cache is None
+    
+    @pytest.mark.unit
+    def test_response_cache_keys_are_digests(self):
+        """Test that the response cache stores short digest keys but matches on full inputs"""
+        cache = DigestKeyedCache(maxsize=2)
+        cache.update("prompt" * 1000, "llm", ["generation"])
+        
+        assert cache.lookup("prompt" * 1000, "llm") == ["generation"]
+        assert cache.lookup("prompt" * 1000, "other-llm") is None
+        assert all(len(prompt) == 32 for prompt, _ in cache._cache)
+    
+    @pytest.mark.unit
+    def test_tool_schemas_converted_once(self):
+        """Test that tool schemas are converted once per tool and reused"""
+        from langchain_core.tools import tool
+        
+        @tool
+        def get_branches(repo: str) -> str:
+            """List branches of a repository"""
+            return repo
+        
+        with patch("src.models.base_provider._tool_schemas", {}), \
+             patch("src.models.base_provider.convert_to_openai_tool", wraps=convert_to_openai_tool) as mock_convert:
+            first = get_tool_schemas([get_branches])
+            second = get_tool_schemas([get_branches])
+        
+        mock_convert.assert_called_once()
+        assert first[0] is second[0]
+        assert first[0]["function"]["name"] == "get_branches"
 
 
 class TestConcreteProviders:
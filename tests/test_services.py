@@ -94,6 +94,154 @@ class TestGitHubService:
             assert result is not None
             assert "repo1" in str(result)
     
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_github_service_agent_created_once(self):
+        """Test that concurrent first calls create a single agent"""
+        service = GitHubService()
+        
+        async def slow_create(*args, **kwargs):
+            await asyncio.sleep(0.01)
+            return MagicMock()
+        
+        with patch('src.services.github_service.get_session_context') as mock_context, \
+             patch('src.services.github_service.create_github_agent', side_effect=slow_create) as mock_create:
+            mock_context.return_value.get_session_parameters.return_value = ("user", "session", "trace", "azure:gpt-4o")
+            
+            agents = await asyncio.gather(*(service._get_agent() for _ in range(3)))
+        
+        assert agents[0] is agents[1] is agents[2]
+        mock_create.assert_called_once()
+    
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_ask_question_caches_answers(self):
+        """Test that repeated questions are answered from the cache until they expire"""
+        service = GitHubService()
+        
+        with patch.object(service, '_get_agent') as mock_get_agent:
+            mock_agent = AsyncMock()
+            mock_agent.ainvoke.return_value = "Branches: main"
+            mock_get_agent.return_value = mock_agent
+            
+            assert await service.get_repository_branches("owner", "repo") == "Branches: main"
+            assert await service.get_repository_branches("owner", "repo") == "Branches: main"
+            assert mock_agent.ainvoke.call_count == 1
+            
+            with patch('src.services.github_service.time.monotonic', return_value=float("inf")):
+                await service.get_repository_branches("owner", "repo")
+            assert mock_agent.ainvoke.call_count == 2
+    
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_ask_question_coalesces_concurrent_calls(self):
+        """Test that concurrent identical questions share one agent invocation"""
+        service = GitHubService()
+        
+        async def slow_answer(question, message_id, **kwargs):
+            await asyncio.sleep(0.01)
+            return "Repository info"
+        
+        with patch.object(service, '_get_agent') as mock_get_agent:
+            mock_agent = AsyncMock()
+            mock_agent.ainvoke.side_effect = slow_answer
+            mock_get_agent.return_value = mock_agent
+            
+            results = await asyncio.gather(*(service.get_repository_info("owner", "repo") for _ in range(3)))
+            
+            assert results == ["Repository info"] * 3
+            assert mock_agent.ainvoke.call_count == 1
+            assert not service._inflight
+    
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_ask_question_skips_caching_errors(self):
+        """Test that agent error answers are not cached"""
+        service = GitHubService()
+        
+        with patch.object(service, '_get_agent') as mock_get_agent:
+            mock_agent = AsyncMock()
+            mock_agent.ainvoke.return_value = "Error processing request: timeout"
+            mock_get_agent.return_value = mock_agent
+            
+            await service.get_user_info()
+            await service.get_user_info()
+            assert mock_agent.ainvoke.call_count == 2
+    
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_get_many_repository_infos(self):
+        """Test that batched repository lookups keep input order"""
+        service = GitHubService()
+        
+        async def answer(question, message_id, **kwargs):
+            return question
+        
+        with patch.object(service, '_get_agent') as mock_get_agent:
+            mock_agent = AsyncMock()
+            mock_agent.ainvoke.side_effect = answer
+            mock_get_agent.return_value = mock_agent
+            
+            repos = [("owner", "first"), ("owner", "second"), ("owner", "third")]
+            results = await service.get_many_repository_infos(repos, concurrency=2)
+        
+        assert len(results) == 3
+        assert all(repo in result for (_, repo), result in zip(repos, results))
+    
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_get_repository_branches_raw_calls_tool_directly(self):
+        """Test that raw branch lookups call the MCP tool once, without the agent"""
+        service = GitHubService()
+        tool = MagicMock()
+        tool.name = "list_branches"
+        tool.ainvoke = AsyncMock(return_value='[{"name": "main"}]')
+        
+        with patch('src.tools.github_tools.get_github_tools', new=AsyncMock(return_value=[tool])), \
+             patch.object(service, '_get_agent') as mock_get_agent:
+            assert await service.get_repository_branches_raw("owner", "repo") == '[{"name": "main"}]'
+            assert await service.get_repository_branches_raw("owner", "repo") == '[{"name": "main"}]'
+            
+            with pytest.raises(ValueError):
+                await service.call_tool("missing_tool", {})
+        
+        tool.ainvoke.assert_called_once_with({"owner": "owner", "repo": "repo"})
+        mock_get_agent.assert_not_called()
+    
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_get_repository_overview_single_question(self):
+        """Test that the overview asks once and splits the JSON reply into sections"""
+        service = GitHubService()
+        
+        with patch.object(service, '_get_agent') as mock_get_agent:
+            mock_agent = AsyncMock()
+            mock_agent.ainvoke.return_value = (
+                'Here it is:\n```json\n{"branches": "main, dev", "repository_info": "A demo repo", '
+                '"pull_requests": ["#1 Fix typo"], "commits": "abc123 Initial commit"}\n```'
+            )
+            mock_get_agent.return_value = mock_agent
+            
+            overview = await service.get_repository_overview("owner", "repo")
+            
+            mock_agent.ainvoke.assert_called_once()
+            assert overview["branches"] == "main, dev"
+            assert overview["repository_info"] == "A demo repo"
+            assert overview["pull_requests"] == '["#1 Fix typo"]'
+            assert overview["commits"] == "abc123 Initial commit"
+            
+            mock_agent.ainvoke.return_value = "Error processing request: timeout"
+            overview = await service.get_repository_overview("owner", "other")
+            assert overview["branches"] is None
+            assert overview["raw"] == "Error processing request: timeout"
+    
+    @pytest.mark.unit
+    def test_get_github_service_is_singleton(self):
+        """Test that get_github_service returns one shared service without awaiting"""
+        from src.services.github_service import get_github_service
+        
+        assert get_github_service() is get_github_service()
+    
     @pytest.mark.unit
     def test_github_service_error_handling(self):
         """Test GitHub service error handling"""
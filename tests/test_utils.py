@@ -3,16 +3,16 @@
 Tests for utility modules
 """
 import pytest
-from unittest.mock import MagicMock, patch, mock_open
+from unittest.mock import AsyncMock, MagicMock, patch, mock_open
 from pathlib import Path
 import uuid
 from typing import Dict, Any
 
-from src.utils.prompt_loader import PromptLoader
+from src.utils.prompt_loader import PromptLoader, compile_template
 from src.utils.session_context import SessionContext
 from src.utils.state import AgentState
 from src.utils.graph import create_agent_graph, should_continue, call_model
-from src.utils.nodes import create_llm_with_tools, validate_provider_config
+from src.utils.nodes import _parse_model_name, create_llm_with_tools, validate_provider_config
 
 
 class TestPromptLoader:
@@ -39,6 +39,7 @@ class TestPromptLoader:
           commits: "List commits"
           file_content: "Get file"
           search_repos: "Search repos"
+          overview: "Repo overview"
         test:
           example_queries:
             - "Example query 1"
@@ -58,7 +59,8 @@ class TestPromptLoader:
                         "pull_request_summary": "PR summary",
                         "commits": "List commits",
                         "file_content": "Get file",
-                        "search_repos": "Search repos"
+                        "search_repos": "Search repos",
+                        "overview": "Repo overview"
                     },
                     "test": {
                         "example_queries": [
@@ -84,6 +86,34 @@ class TestPromptLoader:
             with pytest.raises(FileNotFoundError):
                 loader.load_prompts("nonexistent.yaml")
 
+    
+    @pytest.mark.unit
+    @pytest.mark.parametrize("template", [
+        "What branches are available in the repository {owner}/{repo}?",
+        "Show the latest {limit} pull requests in {owner}/{repo}",
+        "Escaped {{braces}} around {owner}",
+        "Padded {limit:>4} commits",
+        "No fields at all",
+    ])
+    def test_compile_template_matches_format(self, template):
+        """Test that compiled templates render like str.format"""
+        fields = {"owner": "octocat", "repo": "hello-world", "limit": 5}
+        assert compile_template(template)(**fields) == template.format(**fields)
+    
+    @pytest.mark.unit
+    def test_compile_template_positional_fields_and_format(self):
+        """Test that positional fields use str.format and values render via __format__"""
+        assert compile_template("{} and {}")("a", "b") == "a and b"
+        assert compile_template("{1} before {0}")("a", "b") == "b before a"
+        
+        class Formatted:
+            def __str__(self):
+                return "str"
+            
+            def __format__(self, spec):
+                return "format"
+        
+        assert compile_template("{value}")(value=Formatted()) == "{value}".format(value=Formatted())
 
 class TestSessionContext:
     """Test session context management"""
@@ -154,6 +184,16 @@ class TestGraphUtilities:
         from src.utils.graph import create_agent_graph
         assert callable(create_agent_graph)
     
+    @pytest.mark.unit
+    def test_create_agent_graph_reuses_compiled_graph(self):
+        """Test that the same LLM, tools and checkpointer share one compiled graph"""
+        from langgraph.checkpoint.memory import MemorySaver
+        
+        tools = []
+        graph = create_agent_graph(None, tools)
+        assert create_agent_graph(None, list(tools)) is graph
+        assert create_agent_graph(None, tools, checkpointer=MemorySaver()) is not graph
+    
     @pytest.mark.unit
     def test_should_continue_exists(self):
         """Test that should_continue function exists"""
@@ -165,6 +205,54 @@ class TestGraphUtilities:
         """Test that call_model function exists"""
         from src.utils.graph import call_model
         assert callable(call_model)
+    
+    @pytest.mark.unit
+    def test_system_message_is_shared(self):
+        """Test that the system message is built once from the prompt file"""
+        from langchain_core.messages import SystemMessage
+        from src.utils.graph import get_system_message
+        
+        with patch("src.utils.graph.get_prompt_loader") as mock_loader:
+            mock_loader.return_value.get_system_message.return_value = "You are helpful"
+            get_system_message.cache_clear()
+            try:
+                first = get_system_message()
+                second = get_system_message()
+            finally:
+                get_system_message.cache_clear()
+        
+        assert isinstance(first, SystemMessage)
+        assert first is second
+        mock_loader.assert_called_once()
+    
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_call_model_passes_state_messages(self):
+        """Test that call_model awaits the LLM with the state messages as-is"""
+        llm = MagicMock(ainvoke=AsyncMock())
+        state = {"messages": [MagicMock(), MagicMock()]}
+        
+        result = await call_model(llm, state)
+        
+        llm.ainvoke.assert_awaited_once()
+        assert llm.ainvoke.call_args.args[0] is state["messages"]
+        assert result == {"messages": [llm.ainvoke.return_value]}
+    
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_agent_graph_uses_llm_from_run_config(self):
+        """Test that one compiled graph can run with a different LLM per call"""
+        from langchain_core.messages import AIMessage, HumanMessage
+        from langchain_core.runnables import RunnableLambda
+        
+        graph = create_agent_graph(None, [])
+        for reply in ("first", "second"):
+            llm = RunnableLambda(lambda messages, reply=reply: AIMessage(content=reply))
+            result = await graph.ainvoke(
+                {"messages": [HumanMessage(content="Hi")]},
+                config={"configurable": {"llm": llm}}
+            )
+            assert result["messages"][-1].content == reply
 
 
 class TestLLMUtilities:
@@ -176,10 +264,53 @@ class TestLLMUtilities:
         assert validate_provider_config("azure") is not None
         assert validate_provider_config("ollama") is not None
     
+    @pytest.mark.unit
+    def test_parse_model_name_cached(self):
+        """Test that model names are parsed once and invalid names always raise"""
+        assert _parse_model_name("azure:gpt-4o") == ("azure", "gpt-4o")
+        assert _parse_model_name("azure:gpt-4o") is _parse_model_name("azure:gpt-4o")
+        
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                _parse_model_name("gpt-4o")
+    
     @pytest.mark.unit
     def test_create_llm_with_tools_exists(self):
         """Test that create_llm_with_tools function exists"""
         assert callable(create_llm_with_tools)
+    
+    @pytest.mark.unit
+    def test_create_llm_with_tools_reuses_client(self):
+        """Test that the tool-bound client is built once and only the callback is per message"""
+        provider = MagicMock()
+        langfuse_service = MagicMock()
+        tools = [MagicMock()]
+        
+        with patch.dict("src.utils.nodes._PROVIDERS", {"fake": provider}), \
+             patch("src.utils.nodes._llm_cache", {}), \
+             patch("src.utils.nodes._get_services", return_value=(langfuse_service, None, None)), \
+             patch("src.utils.nodes.validate_provider_config", return_value=True):
+            for message_id in ("msg-1", "msg-2"):
+                create_llm_with_tools("fake:model", tools, "user", "session", "trace", message_id)
+        
+        provider.create_tool_llm.assert_called_once()
+        assert langfuse_service.create_callback_handler.call_count == 2
+        assert provider.create_tool_llm.return_value.with_config.call_count == 2
+    
+    @pytest.mark.unit
+    def test_create_llm_with_tools_validates_cached_client(self):
+        """Test that the provider configuration is checked even when the client is cached"""
+        tools = [MagicMock()]
+        
+        with patch.dict("src.utils.nodes._PROVIDERS", {"fake": MagicMock()}), \
+             patch("src.utils.nodes._llm_cache", {}), \
+             patch("src.utils.nodes._get_services", return_value=(MagicMock(), None, None)):
+            with patch("src.utils.nodes.validate_provider_config", return_value=True):
+                create_llm_with_tools("fake:model", tools, "user", "session", "trace", "msg-1")
+            
+            with patch("src.utils.nodes.validate_provider_config", return_value=False):
+                with pytest.raises(RuntimeError):
+                    create_llm_with_tools("fake:model", tools, "user", "session", "trace", "msg-2")
 
 
 class TestCommonUtilities:
@@ -196,6 +327,30 @@ class TestCommonUtilities:
             from pathlib import Path
             common_path = Path(__file__).parent.parent / "src" / "utils" / "common.py"
             assert common_path.exists(), "common.py utility file should exist"
+    
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_interactive_mode_cleans_up_when_cancelled(self):
+        """Test that interrupting interactive mode still closes the MCP session"""
+        import asyncio
+        from src.utils.common import interactive_mode
+        
+        waiting = asyncio.Event()
+        
+        async def wait_forever(prompt):
+            waiting.set()
+            await asyncio.Event().wait()
+        
+        with patch("src.utils.common.create_github_agent", AsyncMock()), \
+             patch("src.utils.common.ainput", wait_forever), \
+             patch("src.utils.common.cleanup_github_tools", AsyncMock()) as cleanup:
+            task = asyncio.create_task(interactive_mode("user", "session", "trace", "azure:gpt-4o"))
+            await waiting.wait()
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+        
+        cleanup.assert_awaited_once()
 
 
 if __name__ == "__main__":